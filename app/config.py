@@ -27,11 +27,20 @@ AZURE_OPENAI_CONFIG = {
         "OpenAI-Organization": os.getenv("ORGANIZATION", "231173"),
         "Shortcode": os.getenv("ORGANIZATION", "231173")
     },
+    # Shared HTTP connection pool for concurrent requests
+    "max_connections": int(os.getenv("OPENAI_MAX_CONNECTIONS", "64")),
+    "max_keepalive_connections": int(os.getenv("OPENAI_MAX_KEEPALIVE", "32")),
+    "connect_timeout": 5.0,
+    "max_concurrent_requests": int(os.getenv("OPENAI_MAX_CONCURRENCY", "32")),
+    # SDK retries: exponential backoff with jitter, honours Retry-After
+    "max_retries": int(os.getenv("OPENAI_MAX_RETRIES", "5")),
 }
 
 # Text processing limits
 TEXT_PROCESSING = {
     "max_tokens": 12000,
+    "extraction_input_tokens": 3000,  # Document budget per extraction call (~12k chars)
+    "naturalization_input_tokens": 1500,  # Document excerpt for slot naturalization (~6k chars)
     "chunk_size": 2000,
     "max_words": {
         "short": 30,
@@ -106,7 +115,10 @@ MONITORING_CONFIG = {
 CACHE_CONFIG = {
     "enabled": os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true",
     "ttl_seconds": int(os.getenv("LLM_CACHE_TTL", "3600")),  # 1 hour
-    "max_size": int(os.getenv("LLM_CACHE_MAX_SIZE", "1000"))
+    "max_size": int(os.getenv("LLM_CACHE_MAX_SIZE", "1000")),
+    # Unset keeps the cache in memory only; a shelve file must not be shared
+    # by several worker processes
+    "backing_path": os.getenv("LLM_CACHE_PATH")
 }
 
 
@@ -2,12 +2,17 @@
 Agent interfaces and protocols for the multi-agent system.
 """
 
+import sys
 from typing import Protocol, Dict, Any, List, Optional, runtime_checkable
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 
+# Slot-backed dataclasses drop the per-instance __dict__; the option needs
+# Python 3.10+, so older interpreters (the 3.9 image) keep plain instances
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class AgentRole(Enum):
     """Standardized roles for agents in the system."""
@@ -20,7 +25,7 @@ class AgentRole(Enum):
     ORCHESTRATOR = "orchestrator"  # Coordinates other agents
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AgentMessage:
     """
     Message format for inter-agent communication.
@@ -43,7 +48,7 @@ class AgentMessage:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AgentContext:
     """
     Shared context for agent collaboration.
@@ -60,18 +65,26 @@ class AgentContext:
     critical_values: list[str] = field(default_factory=list)
     messages: list[AgentMessage] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
-    
+    # Per-recipient index over messages so polling does not scan the full log
+    _inboxes: dict[str, list[AgentMessage]] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        for message in self.messages:
+            self._inboxes.setdefault(message.recipient, []).append(message)
+
     def add_message(self, message: AgentMessage) -> None:
         """Add a message to the context."""
         self.messages.append(message)
+        self._inboxes.setdefault(message.recipient, []).append(message)
     
     def get_messages_for(self, recipient: str) -> list[AgentMessage]:
         """Get all messages for a specific recipient."""
-        return [msg for msg in self.messages if msg.recipient == recipient]
+        return list(self._inboxes.get(recipient, ()))
     
     def clear_messages_for(self, recipient: str) -> None:
         """Clear messages for a specific recipient after processing."""
-        self.messages = [msg for msg in self.messages if msg.recipient != recipient]
+        if self._inboxes.pop(recipient, None):
+            self.messages = [msg for msg in self.messages if msg.recipient != recipient]
 
 
 @runtime_checkable
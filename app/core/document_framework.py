@@ -2,16 +2,13 @@
 Document Generation Framework
 Main orchestrator that combines plugin architecture and Jinja2 templates
 """
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
 from pathlib import Path
-from dataclasses import dataclass, field
-import re
-import hashlib
-from collections import defaultdict
-import numpy as np
-from app.logger import get_logger
+from dataclasses import dataclass
+from app.logger import get_logger, DEBUG
 
-from .plugin_manager import PluginManager, ValidationRuleSet
+from .plugin_manager import PluginManager, ValidationRuleSet, DocumentPlugin
 from .template_renderer import SimpleTemplateRenderer
 from .document_processor import SimpleDocumentProcessor
 from .validators import ValidationOrchestrator, EnhancedValidationOrchestrator
@@ -42,6 +39,14 @@ class GenerationResult:
     error_message: Optional[str] = None
 
 
+@dataclass
+class PluginMeta:
+    """Per-plugin values used when building generation results"""
+    plugin_id: Optional[str]
+    agent_count: int
+    has_workflow: bool
+
+
 # ConsistencyMetrics has been moved to validators.py as part of the refactoring
 # Import it from there for backward compatibility
 from .validators import ConsistencyMetrics
@@ -90,14 +95,21 @@ class DocumentGenerationFramework:
         self.template_engine = SimpleTemplateRenderer(template_dir)
         self.validation_orchestrator = ValidationOrchestrator()
         self.agent_pool = SimpleDocumentProcessor(llm_client=llm)
+        # Per-plugin (validation rules, critical values, agents), filled on first use
+        self._plugin_cache: Dict[DocumentPlugin, Tuple[ValidationRuleSet, List[str], List[Any]]] = {}
+        self._plugin_meta: Dict[DocumentPlugin, PluginMeta] = {}
+        # Global template parameters, rebuilt only after reload_plugins()
+        self._globals_cache: Optional[Dict[str, Any]] = None
     
     def get_global_parameters(self) -> Dict[str, Any]:
-        """Get global parameters for template rendering"""
-        return {
-            "framework_version": "1.0.0",
-            "generation_timestamp": str(Path.cwd()),
-            "available_plugins": self.plugin_manager.list_plugins()
-        }
+        """Get global parameters for template rendering (shared; do not mutate)"""
+        if self._globals_cache is None:
+            self._globals_cache = {
+                "framework_version": "1.0.0",
+                "generation_timestamp": str(Path.cwd()),
+                "available_plugins": self.plugin_manager.list_plugins()
+            }
+        return self._globals_cache
     
     async def generate(self, 
                       document_type: str, 
@@ -129,27 +141,14 @@ class DocumentGenerationFramework:
                     f"No plugin found for document type: {document_type}"
                 )
             
-            # Step 2: Build context from document and parameters
-            context = await self._build_context(parameters, document)
-            context["document_type"] = document_type
-            
-            # Store parameters for workflow tracking
-            self._last_parameters = parameters
-            
-            # Step 3: Resolve template
-            template_path = await self._resolve_template(plugin, parameters)
-            if not template_path:
-                return self._create_error_result("Failed to resolve template")
-            
-            # Step 4: Run agent orchestration
-            agent_results = await self._run_agents(plugin, context)
-            context = self._merge_agent_results(context, agent_results)
-            self._last_context = context  # Store context for metadata extraction
-            
-            # Step 5: Render template
-            rendered_content = await self._render_template(
-                template_path, context
-            )
+            # Steps 2-5: Build context, resolve template, run agents, render
+            async for stage, payload in self._generate_internal(
+                plugin, document_type, parameters, document
+            ):
+                if stage == "error":
+                    return self._create_error_result(payload)
+                if stage == "rendered":
+                    template_path, context, rendered_content = payload
 
             # Validate rendered content
             if not rendered_content or len(rendered_content.strip()) < 100:
@@ -168,7 +167,8 @@ class DocumentGenerationFramework:
             # Step 7: Create final result
             return self._create_generation_result(
                 plugin, template_path, document_type,
-                rendered_content, validation_results
+                rendered_content, validation_results,
+                parameters, context
             )
             
         except DocumentFrameworkError:
@@ -185,6 +185,30 @@ class DocumentGenerationFramework:
         """Select the appropriate plugin for the document type."""
         return self.plugin_manager.get_plugin(document_type)
     
+    def _get_plugin_artifacts(self, plugin) -> Tuple[ValidationRuleSet, List[str], List[Any]]:
+        """Return cached validation rules, critical values and agents for a plugin."""
+        artifacts = self._plugin_cache.get(plugin)
+        if artifacts is None:
+            artifacts = (
+                plugin.get_validation_rules(),
+                plugin.get_critical_values(),
+                plugin.get_specialized_agents()
+            )
+            self._plugin_cache[plugin] = artifacts
+        return artifacts
+    
+    def _get_plugin_meta(self, plugin) -> PluginMeta:
+        """Return cached id, agent count and workflow support for a plugin."""
+        meta = self._plugin_meta.get(plugin)
+        if meta is None:
+            meta = PluginMeta(
+                plugin_id=plugin.get_plugin_info().get("id"),
+                agent_count=len(self._get_plugin_artifacts(plugin)[2]),
+                has_workflow=hasattr(plugin, 'process_workflow')
+            )
+            self._plugin_meta[plugin] = meta
+        return meta
+    
     async def _build_context(self, parameters: Dict[str, Any],
                             document: Optional[Document]) -> Dict[str, Any]:
         """Build context from parameters and optional document.
@@ -205,30 +229,57 @@ class DocumentGenerationFramework:
         """Resolve the template path based on plugin and parameters."""
         return plugin.resolve_template(parameters)
     
-    async def _run_agents(self, plugin: Any, context: dict[str, Any]) -> dict[str, Any]:
-        """Run multi-agent orchestration for document processing."""
+    async def _generate_internal(self, plugin, document_type: str,
+                                 parameters: Dict[str, Any],
+                                 document: Optional[Document]):
+        """
+        Shared generation pipeline behind generate() and stream_generate().
+        
+        Yields:
+            (stage, payload) tuples: ("agent", (done, total)) after each plugin
+            agent, ("error", message) if the template cannot be resolved, and
+            finally ("rendered", (template_path, context, rendered_content)).
+        """
+        # Build context from document and parameters
+        context = await self._build_context(parameters, document)
+        context["document_type"] = document_type
+        
+        # Resolve the template first so a bad request fails before any LLM calls
+        template_path = await self._resolve_template(plugin, parameters)
+        if not template_path:
+            yield "error", "Failed to resolve template"
+            return
+        
+        agent_results: Dict[str, Any] = {}
+        async for stage, payload in self._iter_agents(plugin, context):
+            if stage == "agents_done":
+                agent_results = payload
+            else:
+                yield stage, payload
+        
+        context = self._merge_agent_results(context, agent_results)
+        
+        rendered_content = await self._render_template(template_path, context)
+        yield "rendered", (template_path, context, rendered_content)
+    
+    async def _iter_agents(self, plugin: Any, context: dict[str, Any]):
+        """
+        Run agents for the plugin, reporting progress as they finish.
+        
+        Yields:
+            ("agent", (done, total)) after each plugin agent, then
+            ("agents_done", results) with the accumulated agent output
+        """
         # Use plugin's specialized agents if available
-        agents = plugin.get_specialized_agents()
+        agents = self._get_plugin_artifacts(plugin)[2]
         
         if agents:
-            # Create AgentContext for plugin agents
-            from app.core.agent_interfaces import AgentContext
-            agent_context = AgentContext(
-                document_type=context.get("document_type", "informed-consent"),
-                parameters=context
-            )
-            
-            # Run each agent in sequence
-            for agent in agents:
-                if hasattr(agent, 'process'):
-                    result = await agent.process(agent_context)
-                    # Merge results back into context
-                    if isinstance(result, dict) and result.get("status") == "success":
-                        if "extracted" in result:
-                            agent_context.extracted_values.update(result["extracted"])
+            agent_context = self._create_agent_context(context)
+            async for progress in self._process_agents(agents, agent_context):
+                yield "agent", progress
             
             # Return the accumulated context
-            return {
+            yield "agents_done", {
                 "extracted_values": agent_context.extracted_values,
                 "generated_content": agent_context.generated_content,
                 "validation_results": agent_context.validation_results
@@ -249,12 +300,39 @@ class DocumentGenerationFramework:
                 output_schema=output_schema
             )
             
-            return {
+            yield "agents_done", {
                 "extracted_values": processing_context.extracted_values,
                 "generated_content": processing_context.generated_content,
                 "validation_results": processing_context.validation_results
             }
     
+    def _create_agent_context(self, context: dict[str, Any]):
+        """Create the shared AgentContext handed to plugin agents."""
+        from app.core.agent_interfaces import AgentContext
+        return AgentContext(
+            document_type=context.get("document_type", "informed-consent"),
+            parameters=context
+        )
+    
+    async def _process_agents(self, agents: List[Any], agent_context):
+        """
+        Run plugin agents against a shared context, yielding after each one.
+        
+        Agents run in sequence because later agents read what earlier ones
+        wrote to the context (e.g. naturalization consumes extracted values).
+        
+        Yields:
+            Tuple of (completed agent count, total agent count)
+        """
+        runnable = [agent for agent in agents if hasattr(agent, 'process')]
+        for index, agent in enumerate(runnable, 1):
+            result = await agent.process(agent_context)
+            # Merge results back into context
+            if isinstance(result, dict) and result.get("status") == "success":
+                if "extracted" in result:
+                    agent_context.extracted_values.update(result["extracted"])
+            yield index, len(runnable)
+    
     def _merge_agent_results(self, context: dict[str, Any], 
                            agent_results) -> Dict[str, Any]:
         """Merge agent results into the context.
@@ -279,57 +357,63 @@ class DocumentGenerationFramework:
     async def _render_template(self, template_path: str, 
                               context: Dict[str, Any]) -> str:
         """Render the template with the provided context."""
-        # Merge global parameters into context for SimpleTemplateRenderer
-        full_context = {**context, **self.get_global_parameters()}
+        # Global parameters are merged during flattening, so the context
+        # is copied once per render instead of twice
         return self.template_engine.render(
             template_path=template_path,
-            context=full_context
+            context=context,
+            global_params=self.get_global_parameters()
         )
     
     async def _validate_output(self, plugin, context: Dict[str, Any], 
                               rendered: str) -> Dict[str, Any]:
         """Validate the rendered output against plugin rules."""
-        validation_rules = plugin.get_validation_rules()
-        critical_values = plugin.get_critical_values()
+        validation_rules, critical_values, _ = self._get_plugin_artifacts(plugin)
         
-        result = self.validation_orchestrator.validate(
+        # Validation is CPU-bound regex/string work; keep it off the event loop
+        result = await asyncio.to_thread(
+            self.validation_orchestrator.validate,
             original=context,
             rendered=rendered,
             rules=validation_rules,
             critical_values=critical_values
         )
         
-        # Debug logging
-        logger.debug(f"Validation result - passed: {result.get('passed', 'N/A')}")
-        if result.get('issues'):
-            logger.debug(f"Validation issues: {result['issues'][:3]}")
+        # Debug logging (lazy formatting; skipped entirely when DEBUG is off)
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Validation result - passed: %s", result.get('passed', 'N/A'))
+            if result.get('issues'):
+                logger.debug("Validation issues: %s", result['issues'][:3])
         
         return result
     
     def _create_generation_result(self, plugin, template_path: str,
                                  document_type: str, content: str,
-                                 validation_results: Dict[str, Any]) -> GenerationResult:
-        """Create the final GenerationResult with metadata."""
+                                 validation_results: Dict[str, Any],
+                                 parameters: Optional[Dict[str, Any]] = None,
+                                 context: Optional[Dict[str, Any]] = None) -> GenerationResult:
+        """Create the final GenerationResult with metadata.
+        
+        The request's parameters and merged context are passed in rather than
+        kept on the instance, so concurrent generations cannot see each other's.
+        """
+        plugin_meta = self._get_plugin_meta(plugin)
         metadata = {
-            "plugin_id": plugin.get_plugin_info().get("id"),
+            "plugin_id": plugin_meta.plugin_id,
             "template_used": template_path,
             "document_type": document_type,
             "chunking_method": "SPLICE",
-            "agents_used": len(plugin.get_specialized_agents())
+            "agents_used": plugin_meta.agent_count
         }
         
         # Add workflow tracking if plugin supports it
-        if hasattr(plugin, 'process_workflow'):
-            # Get parameters from the last generation context
-            parameters = getattr(self, '_last_parameters', {})
-            workflow_steps = plugin.process_workflow(parameters, content)
+        if plugin_meta.has_workflow:
+            workflow_steps = plugin.process_workflow(parameters or {}, content)
             metadata["workflow_steps"] = workflow_steps
         
         # Include agent metadata if available (evidence data)
-        if hasattr(self, '_last_context') and 'agent_metadata' in self._last_context:
-            agent_metadata = self._last_context['agent_metadata']
-            if agent_metadata:
-                metadata.update(agent_metadata)
+        if context and context.get('agent_metadata'):
+            metadata.update(context['agent_metadata'])
         
         return GenerationResult(
             success=validation_results["passed"],
@@ -362,10 +446,14 @@ class DocumentGenerationFramework:
     def reload_plugins(self):
         """Reload all plugins (useful for development)"""
         self.plugin_manager.reload_plugins()
+        self._plugin_cache.clear()
+        self._plugin_meta.clear()
+        self._globals_cache = None
+        self.template_engine.clear_cache()
     
     def clear_template_cache(self):
-        """Clear template value cache - deprecated, no longer uses cache"""
-        pass
+        """Clear compiled templates so edited template files are reloaded"""
+        self.template_engine.clear_cache()
     
     async def stream_generate(self, 
                              document_type: str,
@@ -383,35 +471,27 @@ class DocumentGenerationFramework:
             yield f"Error: No plugin found for {document_type}"
             return
         
-        # Document available for processing
-        if document:
-            parameters["document"] = document
-            parameters["document_text"] = document.text
-        
-        # Stream template rendering
-        template_path = plugin.resolve_template(parameters)
-        
-        # For streaming, we'll process in chunks
-        # This is a simplified version - production would be more sophisticated
-        agents = plugin.get_specialized_agents()
-        
-        # Process agents and stream results
-        for i, agent in enumerate(agents):
-            if hasattr(agent, 'process'):
-                result = await agent.process(parameters)
-                yield f"Processing agent {i+1}/{len(agents)}...\n"
-                
-        # Final rendering
-        context = await self.agent_pool.orchestrate(agents, parameters)
-        rendered = self.template_engine.render(
-            template_path=template_path,
-            context=context,
-            globals=self.get_global_parameters()
-        )
+        # Share the generate() pipeline, reporting progress as agents finish
+        rendered = ""
+        async for stage, payload in self._generate_internal(
+            plugin, document_type, parameters, document
+        ):
+            if stage == "agent":
+                done, total = payload
+                yield f"Processing agent {done}/{total}...\n"
+            elif stage == "error":
+                yield f"Error: {payload}"
+                return
+            elif stage == "rendered":
+                rendered = payload[2]
         
-        # Stream the final result in chunks
-        words = rendered.split()
-        batch_size = 10
-        for i in range(0, len(words), batch_size):
-            batch = words[i:i + batch_size]
-            yield ' '.join(batch) + ' '
+        # Stream the final result in chunks, slicing at the first space past
+        # the chunk budget so no intermediate word list is built
+        chunk_size = ProcessingConstants.STREAM_CHUNK_SIZE
+        start = 0
+        length = len(rendered)
+        while start < length:
+            end = rendered.find(' ', start + chunk_size)
+            end = length if end == -1 else end + 1
+            yield rendered[start:end]
+            start = end
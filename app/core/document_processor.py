@@ -2,8 +2,9 @@
 Simplified Document Processing Pipeline
 Replaces complex multi-agent system with clean functions
 """
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass, field
+import asyncio
 from app.core.unified_extractor import UnifiedExtractor
 from app.core.validators import ValidationOrchestrator
 from app.core.exceptions import ExtractionError
@@ -11,23 +12,30 @@ from app.logger import get_logger
 
 logger = get_logger("core.document_processor")
 
+# Static prompt and summary layouts, built once at import. The instructions
+# live in the system message so the request prefix is identical across
+# documents; only the short user message varies.
+INTRODUCTION_SYSTEM_PROMPT = (
+    "Generate a brief, clear introduction for a research study. "
+    "Keep it under 100 words and focus on the purpose."
+)
+INTRODUCTION_PROMPT = "Study Title: {title}"
+
+SUMMARY_PARTS = (
+    ("purpose", "Purpose: "),
+    ("duration", "Duration: "),
+    ("risks", "Main risks: "),
+)
+
 
 @dataclass
 class ProcessingContext:
     """Simple context for document processing"""
     document_text: str
     document_type: str
-    extracted_values: Dict[str, Any] = None
-    generated_content: Dict[str, Any] = None
-    validation_results: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        if self.extracted_values is None:
-            self.extracted_values = {}
-        if self.generated_content is None:
-            self.generated_content = {}
-        if self.validation_results is None:
-            self.validation_results = {}
+    extracted_values: Dict[str, Any] = field(default_factory=dict)
+    generated_content: Dict[str, Any] = field(default_factory=dict)
+    validation_results: Dict[str, Any] = field(default_factory=dict)
 
 
 class SimpleDocumentProcessor:
@@ -46,6 +54,8 @@ class SimpleDocumentProcessor:
         self.extractor = UnifiedExtractor(llm_client)
         self.validator = ValidationOrchestrator()
         self.llm_client = llm_client
+        # In-flight extractions keyed by (document text, schema), shared by concurrent callers
+        self._inflight_extractions: Dict[Tuple[str, Any], asyncio.Future] = {}
     
     async def process(self, 
                      document_text: str,
@@ -72,10 +82,7 @@ class SimpleDocumentProcessor:
         
         # Step 1: Extract structured data
         try:
-            extracted = await self.extractor.extract(
-                document=document_text,
-                output_schema=output_schema
-            )
+            extracted = await self._extract_shared(document_text, output_schema)
 
             # Convert to dict if needed
             if hasattr(extracted, 'model_dump'):
@@ -118,6 +125,32 @@ class SimpleDocumentProcessor:
         
         return context
     
+    async def _extract_shared(self, document_text: str, output_schema: Any) -> Any:
+        """
+        Extract structured data, coalescing concurrent requests for the same document.
+        
+        Concurrent calls with identical text and schema await one extractor
+        call instead of each issuing their own LLM request.
+        
+        Args:
+            document_text: Document to extract from
+            output_schema: Schema for structured output
+            
+        Returns:
+            Extractor result shared by all concurrent callers
+        """
+        key = (document_text, output_schema)
+        task = self._inflight_extractions.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.extractor.extract(
+                document=document_text,
+                output_schema=output_schema
+            ))
+            self._inflight_extractions[key] = task
+            task.add_done_callback(lambda _: self._inflight_extractions.pop(key, None))
+        # Shield so one caller being cancelled does not cancel the others
+        return await asyncio.shield(task)
+    
     async def _generate_content(self, context: ProcessingContext) -> Dict[str, Any]:
         """
         Generate content based on extracted values.
@@ -133,12 +166,11 @@ class SimpleDocumentProcessor:
         
         # Generate introduction if title available
         if "study_title" in extracted:
-            prompt = f"""Generate a brief, clear introduction for a research study.
-            Study Title: {extracted['study_title']}
-            Keep it under 100 words and focus on the purpose."""
-            
             try:
-                response = await self.llm_client.complete(prompt)
+                prompt = INTRODUCTION_PROMPT.format(title=extracted['study_title'])
+                response = await self.llm_client.complete(
+                    prompt, system_prompt=INTRODUCTION_SYSTEM_PROMPT
+                )
                 generated["introduction"] = response
             except Exception as e:
                 logger.error(f"Generation failed: {e}")
@@ -159,14 +191,9 @@ class SimpleDocumentProcessor:
     
     def _format_summary(self, info: Dict[str, Any]) -> str:
         """Format summary from key information"""
-        parts = []
-        if info.get("purpose"):
-            parts.append(f"Purpose: {info['purpose']}")
-        if info.get("duration"):
-            parts.append(f"Duration: {info['duration']}")
-        if info.get("risks"):
-            parts.append(f"Main risks: {info['risks']}")
-        return " ".join(parts)
+        return " ".join(
+            f"{label}{info[key]}" for key, label in SUMMARY_PARTS if info.get(key)
+        )
     
     def _validate(self, 
                  context: ProcessingContext,
@@ -192,9 +219,14 @@ class SimpleDocumentProcessor:
             intent_critical_fields=critical_fields
         )
         
-        # Combine extracted and generated for validation
+        # Validate the text itself rather than a dict repr, whose quoting and
+        # escaping would hide multi-line or backslashed critical values
         all_content = {**context.extracted_values, **context.generated_content}
-        rendered = str(all_content)
+        rendered = "\n\n".join(
+            value if isinstance(value, str) else str(value)
+            for value in all_content.values()
+            if value is not None
+        )
         
         # Run validation
         results = self.validator.validate(
@@ -43,9 +43,7 @@ class ValidationError(DocumentFrameworkError):
     """Raised when validation fails."""
     
     def __init__(self, field: str, message: str, value: Any = None):
-        details = {"field": field}
-        if value is not None:
-            details["value"] = value
+        details = {"field": field} if value is None else {"field": field, "value": value}
         super().__init__(f"Validation error for '{field}': {message}", details)
         self.field = field
         self.value = value
@@ -73,18 +71,6 @@ class TemplateRenderError(TemplateError):
         super().__init__(template_path, f"Rendering failed: {reason}")
 
 
-class ExtractionError(DocumentFrameworkError):
-    """Raised when document extraction fails."""
-    
-    def __init__(self, message: str, document_type: Optional[str] = None, details: Optional[dict[str, Any]] = None):
-        if details is None:
-            details = {}
-        if document_type:
-            details["document_type"] = document_type
-        super().__init__(message, details)
-        self.document_type = document_type
-
-
 class LLMError(DocumentFrameworkError):
     """Raised when LLM operations fail."""
     
@@ -126,9 +112,7 @@ class PDFProcessingError(DocumentFrameworkError):
     """Raised when PDF processing fails."""
 
     def __init__(self, filename: str, message: str, page: Optional[int] = None):
-        details = {"filename": filename}
-        if page is not None:
-            details["page"] = page
+        details = {"filename": filename} if page is None else {"filename": filename, "page": page}
         super().__init__(f"PDF processing error in '{filename}': {message}", details)
         self.filename = filename
         self.page = page
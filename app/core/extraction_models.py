@@ -2,11 +2,50 @@
 Pydantic models for structured extraction
 Defines strongly-typed models for extracting information from documents
 """
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List, Literal, Dict, Any
 from enum import Enum
 import re
 
+from app.core.utils import TextProcessingUtils
+
+
+# Extraction results are read-only snapshots: freezing skips assignment
+# handling, and unknown keys from LLM JSON are dropped rather than kept
+_EXTRACTION_CONFIG = ConfigDict(frozen=True, extra='ignore')
+
+# Compiled once; the duration validator runs on every extraction
+_DURATION_RE = re.compile(r'\d+\s*\w+')
+_DURATION_PLACEHOLDERS = frozenset({
+    'not specified', 'unknown', 'varies', 'the study period', 'tbd', 'n/a'
+})
+
+
+def normalize_study_duration(value: str) -> str:
+    """
+    Return the duration unchanged if it looks like a real time span, else "".
+    
+    Kept as a plain typed function so the check can be called (and compiled)
+    independently of the Pydantic validator that wraps it.
+    
+    Args:
+        value: Raw study duration from extraction
+        
+    Returns:
+        The original value, or an empty string for blanks and placeholders
+    """
+    if not value:
+        return value
+    
+    cleaned: str = TextProcessingUtils.clean_whitespace(value).lower()
+    
+    # Simplified placeholder check
+    if cleaned in _DURATION_PLACEHOLDERS:
+        return ""
+    
+    # Simplified pattern check
+    return value if _DURATION_RE.search(cleaned) else ""
+
 
 class ReasoningStep(BaseModel):
     """Represents a single step in chain-of-thought reasoning"""
@@ -51,6 +90,8 @@ class KIExtractionSchema(BaseModel):
     Schema for extracting Key Information from Informed Consent documents
     All fields have strict validation and word limits
     """
+    model_config = _EXTRACTION_CONFIG
+    
     # Section 1 - Eligibility
     is_pediatric: bool = Field(
         description="Are children eligible to participate? Look for age requirements, pediatric participants, or parent/guardian consent."
@@ -120,20 +161,7 @@ class KIExtractionSchema(BaseModel):
     @classmethod
     def validate_duration(cls, v: str) -> str:
         """Validate study duration is a real duration, not a placeholder"""
-        if not v:
-            return v
-        
-        # Use existing text processing utilities
-        from app.core.utils import TextProcessingUtils
-        cleaned = TextProcessingUtils.clean_whitespace(v).lower()
-        
-        # Simplified placeholder check
-        placeholders = {'not specified', 'unknown', 'varies', 'the study period', 'tbd', 'n/a'}
-        if cleaned in placeholders:
-            return ""
-        
-        # Simplified pattern check
-        return v if re.search(r'\d+\s*\w+', cleaned) else ""
+        return normalize_study_duration(v)
     
     # Section 9 - Alternatives
     affects_treatment: bool = Field(
@@ -162,6 +190,8 @@ class ClinicalProtocolExtractionSchema(BaseModel):
     """
     Schema for extracting information from Clinical Protocol documents
     """
+    model_config = _EXTRACTION_CONFIG
+    
     protocol_title: str = Field(
         description="Full title of the clinical protocol"
     )
@@ -224,6 +254,8 @@ class GenericExtractionSchema(BaseModel):
     """
     Generic schema for document extraction when specific schema is not available
     """
+    model_config = _EXTRACTION_CONFIG
+    
     title: Optional[str] = Field(
         default=None,
         description="Document title if present"
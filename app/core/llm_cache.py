@@ -1,34 +1,85 @@
 """
-Simple in-memory LLM response cache.
+Simple in-memory LLM response cache with an optional on-disk backing store.
 Reduces API calls and improves response times for repeated requests.
 """
 import hashlib
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
-from app.logger import get_logger
+import shelve
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple, Type, TypeVar
+from pydantic import BaseModel, ValidationError
+from app.logger import get_logger, DEBUG
 from app.core.monitoring import get_monitor
 
 logger = get_logger("core.llm_cache")
 
+T = TypeVar('T', bound=BaseModel)
+
+
+def extraction_cache_prompt(system_prompt: str, user_content: str) -> str:
+    """Cache prompt for a structured extraction request."""
+    return f"{system_prompt}\x00{user_content}"
+
+
+def completion_cache_prompt(system_prompt: Optional[str], prompt: str, max_tokens: int) -> str:
+    """Cache prompt for a text completion; max_tokens bounds the output, so it is keyed too."""
+    return f"{system_prompt or ''}\x00{prompt}\x00{max_tokens}"
+
+
+def _schema_namespace(schema: Type[BaseModel]) -> str:
+    """Cache key namespace for parsed results; same-named schemas in different modules stay apart."""
+    return f"{schema.__module__}.{schema.__qualname__}"
+
+
+def cache_for_temperature(cache: Optional["LLMCache"], temperature: float) -> Optional["LLMCache"]:
+    """Return the cache only at temperature 0, the only output repeatable enough to memoize."""
+    return cache if temperature == 0 else None
+
 
 class LLMCache:
     """Simple in-memory cache for LLM responses."""
 
-    def __init__(self, ttl_seconds: int = 3600, max_size: int = 1000):
+    def __init__(self, ttl_seconds: int = 3600, max_size: int = 1000,
+                 backing_path: Optional[str] = None):
         """
         Initialize the LLM cache.
 
         Args:
             ttl_seconds: Time-to-live for cache entries in seconds (default: 1 hour)
             max_size: Maximum number of entries to cache (default: 1000)
+            backing_path: Optional shelve file persisting entries across restarts.
+                Single-process only: dbm files are not safe to share between
+                server workers, and disk reads and writes run synchronously
+                under the cache lock. Call close() on shutdown to flush it.
+                Evicted entries are deleted from it, and expired ones are
+                swept when it is opened, so it stays near max_size.
         """
-        self.cache: Dict[str, Dict[str, Any]] = {}
-        self.ttl = timedelta(seconds=ttl_seconds)
+        # key -> (response or parsed model, monotonic timestamp), least recently used first
+        self.cache: "OrderedDict[bytes, Tuple[Any, float]]" = OrderedDict()
+        self.ttl_seconds = float(ttl_seconds)
         self.max_size = max_size
         self.monitor = get_monitor()
-        logger.info(f"LLM cache initialized with TTL={ttl_seconds}s, max_size={max_size}")
+        # Bound once; lookups report a hit or miss on every call
+        self._on_hit = self.monitor.track_cache_hit
+        self._on_miss = self.monitor.track_cache_miss
+        # Cache operations never await, so asyncio tasks cannot interleave
+        # inside them; the lock only guards callers on worker threads
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        # hex key -> (value, wall-clock timestamp); monotonic time does not
+        # survive a restart, so the disk layer ages entries by time.time()
+        self._disk: Optional[shelve.Shelf] = shelve.open(backing_path) if backing_path else None
+        if self._disk is not None:
+            self._sweep_disk()
+        logger.info(f"LLM cache initialized with TTL={ttl_seconds}s, max_size={max_size}"
+                    + (f", backing_path={backing_path}" if backing_path else ""))
 
-    def _get_cache_key(self, prompt: str, model: str, temperature: float) -> str:
+    def _get_cache_key(self, prompt: str, model: str, temperature: float,
+                       namespace: str = "") -> bytes:
         """
         Generate cache key from request parameters.
 
@@ -36,38 +87,126 @@ class LLMCache:
             prompt: The prompt text
             model: Model name
             temperature: Temperature setting
+            namespace: Optional qualifier keeping parsed results apart from raw text
 
         Returns:
-            SHA256 hash of the parameters
+            16-byte BLAKE2b digest of the parameters
         """
-        key_data = f"{prompt}:{model}:{temperature}"
-        return hashlib.sha256(key_data.encode()).hexdigest()
+        digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16)
+        digest.update(f"\x00{model}\x00{temperature}\x00{namespace}".encode("utf-8"))
+        return digest.digest()
 
-    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+    def _is_expired(self, timestamp: float) -> bool:
         """
         Check if a cache entry has expired.
 
         Args:
-            entry: Cache entry with timestamp
+            timestamp: Monotonic time the entry was stored
 
         Returns:
             True if expired
         """
-        if "timestamp" not in entry:
-            return True
-        age = datetime.utcnow() - entry["timestamp"]
-        return age > self.ttl
-
-    def _evict_oldest(self):
-        """Evict oldest cache entry if at max capacity."""
-        if len(self.cache) >= self.max_size:
-            # Find oldest entry
-            oldest_key = min(
-                self.cache.keys(),
-                key=lambda k: self.cache[k].get("timestamp", datetime.min)
-            )
-            del self.cache[oldest_key]
-            logger.debug(f"Evicted cache entry: {oldest_key[:8]}...")
+        return time.monotonic() - timestamp > self.ttl_seconds
+
+    def _sweep_disk(self) -> None:
+        """Drop expired entries left in the backing store by earlier runs."""
+        now = time.time()
+        expired = [
+            disk_key for disk_key, (_, stored_at) in self._disk.items()
+            if now - stored_at > self.ttl_seconds
+        ]
+        for disk_key in expired:
+            del self._disk[disk_key]
+        if expired:
+            logger.info(f"Removed {len(expired)} expired entries from the backing store")
+
+    def _lookup(self, key: bytes, schema: Optional[Type[BaseModel]] = None) -> Optional[Any]:
+        """Return the live value for a key, updating recency and hit/miss stats."""
+        entry = self.cache.get(key)
+        if entry is not None:
+            value, timestamp = entry
+            if self._is_expired(timestamp):
+                # Remove expired entry
+                del self.cache[key]
+                self._expirations += 1
+                if logger.isEnabledFor(DEBUG):
+                    logger.debug("Cache expired: %s...", key.hex()[:8])
+            elif schema is None or isinstance(value, schema):
+                # Mark as most recently used
+                self.cache.move_to_end(key)
+                self._hits += 1
+                self._on_hit()
+                if logger.isEnabledFor(DEBUG):
+                    logger.debug("Cache hit: %s...", key.hex()[:8])
+                return value
+
+        if self._disk is not None:
+            value = self._lookup_disk(key, schema)
+            if value is not None:
+                self._hits += 1
+                self._on_hit()
+                return value
+
+        self._misses += 1
+        self._on_miss()
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Cache miss: %s...", key.hex()[:8])
+        return None
+
+    def _lookup_disk(self, key: bytes, schema: Optional[Type[BaseModel]] = None) -> Optional[Any]:
+        """
+        Return a live value from the backing store, promoting it to memory.
+
+        Parsed results are stored as JSON and re-validated against the
+        current schema, so entries written before a schema change are
+        dropped instead of resurfacing as stale objects.
+        """
+        disk_key = key.hex()
+        entry = self._disk.get(disk_key)
+        if entry is None:
+            return None
+
+        value, stored_at = entry
+        age = time.time() - stored_at
+        if age > self.ttl_seconds:
+            del self._disk[disk_key]
+            self._expirations += 1
+            return None
+
+        if schema is not None:
+            try:
+                value = schema.model_validate_json(value)
+            except ValidationError:
+                del self._disk[disk_key]
+                return None
+
+        # Keep the original age so promotion does not extend the TTL
+        self._store(key, value, time.monotonic() - age, persist=False)
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Cache hit (disk): %s...", disk_key[:8])
+        return value
+
+    def _store(self, key: bytes, value: Any, timestamp: Optional[float] = None,
+               persist: bool = True) -> None:
+        """Store a value as most recently used, evicting the LRU entry if full."""
+        self.cache[key] = (value, time.monotonic() if timestamp is None else timestamp)
+        self.cache.move_to_end(key)
+        if persist and self._disk is not None:
+            stored = value.model_dump_json() if isinstance(value, BaseModel) else value
+            self._disk[key.hex()] = (stored, time.time())
+
+        # Evict the least recently used entry if over capacity
+        if len(self.cache) > self.max_size:
+            evicted_key, _ = self.cache.popitem(last=False)
+            self._evictions += 1
+            # The backing store mirrors the bounded memory cache
+            if self._disk is not None:
+                self._disk.pop(evicted_key.hex(), None)
+            if logger.isEnabledFor(DEBUG):
+                logger.debug("Evicted cache entry: %s...", evicted_key.hex()[:8])
+
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Cached response: %s... (size: %d)", key.hex()[:8], len(self.cache))
 
     def get(self, prompt: str, model: str, temperature: float) -> Optional[str]:
         """
@@ -82,21 +221,8 @@ class LLMCache:
             Cached response or None if not found/expired
         """
         key = self._get_cache_key(prompt, model, temperature)
-
-        if key in self.cache:
-            entry = self.cache[key]
-            if not self._is_expired(entry):
-                self.monitor.track_cache_hit()
-                logger.debug(f"Cache hit: {key[:8]}...")
-                return entry["response"]
-            else:
-                # Remove expired entry
-                del self.cache[key]
-                logger.debug(f"Cache expired: {key[:8]}...")
-
-        self.monitor.track_cache_miss()
-        logger.debug(f"Cache miss: {key[:8]}...")
-        return None
+        with self._lock:
+            return self._lookup(key)
 
     def set(self, prompt: str, model: str, temperature: float, response: str):
         """
@@ -109,58 +235,117 @@ class LLMCache:
             response: The response to cache
         """
         key = self._get_cache_key(prompt, model, temperature)
+        with self._lock:
+            self._store(key, response)
 
-        # Evict if at capacity
-        self._evict_oldest()
+    def get_parsed(self, prompt: str, model: str, temperature: float,
+                   schema: Type[T]) -> Optional[T]:
+        """
+        Get a previously validated structured result without re-validating it.
 
-        self.cache[key] = {
-            "response": response,
-            "timestamp": datetime.utcnow()
-        }
-        logger.debug(f"Cached response: {key[:8]}... (size: {len(self.cache)})")
+        Args:
+            prompt: The prompt text
+            model: Model name
+            temperature: Temperature setting
+            schema: Pydantic model the result was parsed into
+
+        Returns:
+            Deep copy of the cached model instance, or None if not
+            found/expired. Even frozen models can hold mutable lists, so
+            callers never share state with the cache.
+        """
+        key = self._get_cache_key(prompt, model, temperature, _schema_namespace(schema))
+        with self._lock:
+            result = self._lookup(key, schema)
+        if result is None:
+            return None
+        return result.model_copy(deep=True)
+
+    def set_parsed(self, prompt: str, model: str, temperature: float, result: BaseModel):
+        """
+        Cache a validated structured result.
+
+        Args:
+            prompt: The prompt text
+            model: Model name
+            temperature: Temperature setting
+            result: Validated Pydantic model instance; a deep copy is stored
+                so later changes to the caller's object do not reach the cache
+        """
+        key = self._get_cache_key(prompt, model, temperature, _schema_namespace(type(result)))
+        snapshot = result.model_copy(deep=True)
+        with self._lock:
+            self._store(key, snapshot)
 
     def clear(self):
         """Clear all cache entries."""
-        count = len(self.cache)
-        self.cache.clear()
+        with self._lock:
+            count = len(self.cache)
+            self.cache.clear()
+            if self._disk is not None:
+                self._disk.clear()
         logger.info(f"Cache cleared: {count} entries removed")
 
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(self, deep: bool = False) -> Dict[str, Any]:
         """
         Get cache statistics.
 
+        Args:
+            deep: Also scan every entry to count those already expired
+
         Returns:
             Dictionary with cache stats
         """
-        expired_count = sum(
-            1 for entry in self.cache.values()
-            if self._is_expired(entry)
-        )
+        with self._lock:
+            stats = {
+                "size": len(self.cache),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "ttl_seconds": self.ttl_seconds
+            }
+            if deep:
+                stats["expired_entries"] = sum(
+                    1 for _, timestamp in self.cache.values()
+                    if self._is_expired(timestamp)
+                )
+        return stats
 
-        return {
-            "size": len(self.cache),
-            "max_size": self.max_size,
-            "expired_entries": expired_count,
-            "ttl_seconds": self.ttl.total_seconds()
-        }
+    def close(self):
+        """Flush and close the backing store, if any."""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
 
 
 # Global cache instance
 _cache: Optional[LLMCache] = None
 
 
-def get_cache(ttl_seconds: int = 3600, max_size: int = 1000) -> LLMCache:
+def get_cache(ttl_seconds: int = 3600, max_size: int = 1000,
+              backing_path: Optional[str] = None) -> LLMCache:
     """
     Get the global LLM cache instance.
 
     Args:
         ttl_seconds: TTL for cache entries (only used on first call)
         max_size: Maximum cache size (only used on first call)
+        backing_path: Optional on-disk store path (only used on first call)
 
     Returns:
         Global LLMCache instance
     """
     global _cache
     if _cache is None:
-        _cache = LLMCache(ttl_seconds=ttl_seconds, max_size=max_size)
+        _cache = LLMCache(ttl_seconds=ttl_seconds, max_size=max_size,
+                          backing_path=backing_path)
     return _cache
+
+
+def close_cache() -> None:
+    """Flush and close the global cache's backing store, if the cache exists."""
+    if _cache is not None:
+        _cache.close()
@@ -2,15 +2,60 @@
 Simplified Azure OpenAI Client
 Clean implementation using OpenAI SDK best practices
 """
-from typing import Dict, Any, Type, Optional
+import asyncio
+import httpx
+from typing import Dict, Any, List, Tuple, Type, Optional, Union
 from pydantic import BaseModel
 from openai import AsyncAzureOpenAI
-from app.config import AZURE_OPENAI_CONFIG
+from app.config import AZURE_OPENAI_CONFIG, CACHE_CONFIG, TEXT_PROCESSING
 from app.core.exceptions import LLMError
+from app.core.llm_cache import (
+    cache_for_temperature, completion_cache_prompt, extraction_cache_prompt, get_cache
+)
+from app.core.types import ProcessingConstants
+from app.core.utils import truncate_to_token_budget
 from app.logger import get_logger
 
 logger = get_logger("core.llm_client")
 
+# Default chain-of-thought prompt for extraction
+EXTRACTION_SYSTEM_PROMPT = (
+    "You are an expert at extracting structured information from documents.\n"
+    "Use chain of thought reasoning:\n"
+    "1. First, identify the relevant sections in the document\n"
+    "2. Extract the requested information accurately\n"
+    "3. Verify the extracted values make sense in context\n"
+    "4. Return the structured output matching the schema\n\n"
+    "Think step-by-step internally, but only return the final structured output."
+)
+EXTRACTION_USER_PREFIX = "Extract information from this document:\n\n"
+
+# Shared across requests; the OpenAI SDK does not mutate messages
+_DEFAULT_SYSTEM_MESSAGE = {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT}
+
+
+# Shared transport so every client draws from one connection pool
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client used for Azure OpenAI requests.
+    
+    Returns:
+        Shared httpx.AsyncClient with a connection pool sized from config
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=AZURE_OPENAI_CONFIG["max_connections"],
+                max_keepalive_connections=AZURE_OPENAI_CONFIG["max_keepalive_connections"],
+            ),
+            timeout=httpx.Timeout(30.0, connect=AZURE_OPENAI_CONFIG["connect_timeout"]),
+        )
+    return _http_client
+
 
 class SimpleLLMClient:
     """
@@ -25,9 +70,16 @@ class SimpleLLMClient:
             api_version=AZURE_OPENAI_CONFIG["api_version"],
             azure_endpoint=AZURE_OPENAI_CONFIG["endpoint"],
             default_headers=AZURE_OPENAI_CONFIG.get("default_headers", {}),
+            http_client=get_http_client(),
+            max_retries=AZURE_OPENAI_CONFIG["max_retries"],
         )
         self.model = AZURE_OPENAI_CONFIG.get("deployment_name", "gpt-4o")
         self.temperature = AZURE_OPENAI_CONFIG.get("temperature", 0.0)
+        self.cache = get_cache(
+            ttl_seconds=CACHE_CONFIG["ttl_seconds"],
+            max_size=CACHE_CONFIG["max_size"],
+            backing_path=CACHE_CONFIG["backing_path"]
+        ) if CACHE_CONFIG["enabled"] else None
     
     async def extract(self,
                      document: str,
@@ -44,23 +96,28 @@ class SimpleLLMClient:
         Returns:
             Instance of the Pydantic model with extracted data
         """
-        # Default chain-of-thought prompt for extraction
-        if not system_prompt:
-            system_prompt = (
-                "You are an expert at extracting structured information from documents.\n"
-                "Use chain of thought reasoning:\n"
-                "1. First, identify the relevant sections in the document\n"
-                "2. Extract the requested information accurately\n"
-                "3. Verify the extracted values make sense in context\n"
-                "4. Return the structured output matching the schema\n\n"
-                "Think step-by-step internally, but only return the final structured output."
-            )
+        if system_prompt:
+            system_message = {"role": "system", "content": system_prompt}
+        else:
+            system_prompt = EXTRACTION_SYSTEM_PROMPT
+            system_message = _DEFAULT_SYSTEM_MESSAGE
         
+        document = truncate_to_token_budget(
+            document, TEXT_PROCESSING["extraction_input_tokens"], self.model
+        )
         messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": f"Extract information from this document:\n\n{document[:12000]}"}
+            system_message,
+            {"role": "user", "content": EXTRACTION_USER_PREFIX + document}
         ]
         
+        # Repeat prompts reuse the already-validated result
+        cache = cache_for_temperature(self.cache, self.temperature)
+        cache_prompt = extraction_cache_prompt(system_prompt, messages[1]["content"])
+        if cache:
+            cached = cache.get_parsed(cache_prompt, self.model, self.temperature, schema)
+            if cached is not None:
+                return cached
+        
         try:
             # Use beta.parse for structured outputs with Pydantic
             response = await self.client.beta.chat.completions.parse(
@@ -73,14 +130,14 @@ class SimpleLLMClient:
             
             result = response.choices[0].message.parsed
             
-            # Fallback to manual parsing if needed
+            # Fallback to manual parsing if needed; pydantic-core parses and
+            # validates the raw JSON in one pass without an intermediate dict
             if result is None:
-                import json
-                response_text = response.choices[0].message.content
-                result_dict = json.loads(response_text)
-                result = schema(**result_dict)
+                result = schema.model_validate_json(response.choices[0].message.content)
             
             logger.info(f"Successfully extracted {schema.__name__}")
+            if cache:
+                cache.set_parsed(cache_prompt, self.model, self.temperature, result)
             return result
             
         except Exception as e:
@@ -91,6 +148,32 @@ class SimpleLLMClient:
                 {"schema": schema.__name__}
             )
     
+    async def extract_many(self,
+                          jobs: List[Tuple[str, Type[BaseModel], Optional[str]]],
+                          max_concurrency: int = ProcessingConstants.MAX_CONCURRENT_EXTRACTIONS
+                          ) -> List[Union[BaseModel, LLMError]]:
+        """
+        Run several extractions concurrently, bounded by a semaphore.
+        
+        Args:
+            jobs: (document, schema, system_prompt) tuples, as for extract()
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Results in job order; a failed job yields its LLMError instead
+            of cancelling the others
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(document: str, schema: Type[BaseModel], system_prompt: Optional[str]):
+            async with semaphore:
+                return await self.extract(document, schema, system_prompt)
+        
+        return await asyncio.gather(
+            *(run(*job) for job in jobs),
+            return_exceptions=True
+        )
+    
     async def complete(self,
                       prompt: str,
                       system_prompt: Optional[str] = None,
@@ -111,6 +194,13 @@ class SimpleLLMClient:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
         
+        cache = cache_for_temperature(self.cache, self.temperature)
+        cache_prompt = completion_cache_prompt(system_prompt, prompt, max_tokens)
+        if cache:
+            cached = cache.get(cache_prompt, self.model, self.temperature)
+            if cached is not None:
+                return cached
+        
         try:
             response = await self.client.chat.completions.create(
                 model=self.model,
@@ -119,7 +209,10 @@ class SimpleLLMClient:
                 max_tokens=max_tokens,
             )
             
-            return response.choices[0].message.content
+            content = response.choices[0].message.content
+            if cache and content is not None:
+                cache.set(cache_prompt, self.model, self.temperature, content)
+            return content
             
         except Exception as e:
             logger.error(f"Completion failed: {e}")
@@ -127,4 +220,4 @@ class SimpleLLMClient:
                 "completion",
                 f"Failed to generate completion: {e}",
                 {"prompt_length": len(prompt)}
-            )
\ No newline at end of file
+            )
@@ -2,22 +2,34 @@
 Performance monitoring and metrics tracking.
 Provides lightweight monitoring without external dependencies.
 """
+import inspect
+import threading
 import time
-import psutil
-from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 from functools import wraps
 from app.logger import get_logger
 
+try:
+    import psutil
+except ImportError:  # Optional; only system metrics need it
+    psutil = None
+
 logger = get_logger("core.monitoring")
 
+# Prime psutil's CPU sampler so later non-blocking reads measure the time
+# since the previous call instead of sleeping for a sampling interval
+if psutil is not None:
+    psutil.cpu_percent(interval=None)
+
 
 class PerformanceMonitor:
     """Track performance metrics for the application."""
 
     def __init__(self):
         """Initialize the performance monitor."""
-        self.start_time = datetime.utcnow()
+        self.start_time = time.monotonic()
+        # Counters are updated from request handlers and worker threads alike
+        self._lock = threading.Lock()
         self.metrics = {
             "request_count": 0,
             "error_count": 0,
@@ -36,22 +48,26 @@ class PerformanceMonitor:
             duration: Request duration in seconds
             success: Whether request succeeded
         """
-        self.metrics["request_count"] += 1
-        self.metrics["total_response_time"] += duration
-        if not success:
-            self.metrics["error_count"] += 1
+        with self._lock:
+            self.metrics["request_count"] += 1
+            self.metrics["total_response_time"] += duration
+            if not success:
+                self.metrics["error_count"] += 1
 
     def track_llm_call(self):
         """Track an LLM API call."""
-        self.metrics["llm_call_count"] += 1
+        with self._lock:
+            self.metrics["llm_call_count"] += 1
 
     def track_cache_hit(self):
         """Track a cache hit."""
-        self.metrics["cache_hit_count"] += 1
+        with self._lock:
+            self.metrics["cache_hit_count"] += 1
 
     def track_cache_miss(self):
         """Track a cache miss."""
-        self.metrics["cache_miss_count"] += 1
+        with self._lock:
+            self.metrics["cache_miss_count"] += 1
 
     def track_operation(self, operation: str, duration: float):
         """
@@ -61,19 +77,20 @@ class PerformanceMonitor:
             operation: Name of the operation
             duration: Duration in seconds
         """
-        if operation not in self.operation_times:
-            self.operation_times[operation] = {
-                "count": 0,
-                "total_time": 0.0,
-                "min_time": float('inf'),
-                "max_time": 0.0
-            }
-
-        stats = self.operation_times[operation]
-        stats["count"] += 1
-        stats["total_time"] += duration
-        stats["min_time"] = min(stats["min_time"], duration)
-        stats["max_time"] = max(stats["max_time"], duration)
+        with self._lock:
+            if operation not in self.operation_times:
+                self.operation_times[operation] = {
+                    "count": 0,
+                    "total_time": 0.0,
+                    "min_time": float('inf'),
+                    "max_time": 0.0
+                }
+
+            stats = self.operation_times[operation]
+            stats["count"] += 1
+            stats["total_time"] += duration
+            stats["min_time"] = min(stats["min_time"], duration)
+            stats["max_time"] = max(stats["max_time"], duration)
 
     def get_metrics(self) -> Dict[str, Any]:
         """
@@ -82,31 +99,38 @@ class PerformanceMonitor:
         Returns:
             Dictionary of metrics
         """
-        request_count = self.metrics["request_count"]
+        # Snapshot under the lock so derived rates come from consistent counts
+        with self._lock:
+            metrics = dict(self.metrics)
+            operation_times = {
+                op_name: dict(stats) for op_name, stats in self.operation_times.items()
+            }
+
+        request_count = metrics["request_count"]
         avg_response_time = (
-            self.metrics["total_response_time"] / request_count
+            metrics["total_response_time"] / request_count
             if request_count > 0
             else 0.0
         )
 
         total_cache_ops = (
-            self.metrics["cache_hit_count"] + self.metrics["cache_miss_count"]
+            metrics["cache_hit_count"] + metrics["cache_miss_count"]
         )
         cache_hit_rate = (
-            self.metrics["cache_hit_count"] / total_cache_ops
+            metrics["cache_hit_count"] / total_cache_ops
             if total_cache_ops > 0
             else 0.0
         )
 
         error_rate = (
-            self.metrics["error_count"] / request_count
+            metrics["error_count"] / request_count
             if request_count > 0
             else 0.0
         )
 
         # Calculate operation averages
         operations = {}
-        for op_name, stats in self.operation_times.items():
+        for op_name, stats in operation_times.items():
             operations[op_name] = {
                 "count": stats["count"],
                 "avg_time": stats["total_time"] / stats["count"] if stats["count"] > 0 else 0.0,
@@ -117,33 +141,34 @@ class PerformanceMonitor:
         return {
             "requests": {
                 "total": request_count,
-                "errors": self.metrics["error_count"],
+                "errors": metrics["error_count"],
                 "error_rate": error_rate,
                 "avg_response_time": avg_response_time
             },
             "llm": {
-                "total_calls": self.metrics["llm_call_count"]
+                "total_calls": metrics["llm_call_count"]
             },
             "cache": {
-                "hits": self.metrics["cache_hit_count"],
-                "misses": self.metrics["cache_miss_count"],
+                "hits": metrics["cache_hit_count"],
+                "misses": metrics["cache_miss_count"],
                 "hit_rate": cache_hit_rate
             },
             "operations": operations,
-            "uptime_seconds": (datetime.utcnow() - self.start_time).total_seconds()
+            "uptime_seconds": time.monotonic() - self.start_time
         }
 
     def reset_metrics(self):
         """Reset all metrics (useful for testing)."""
-        self.metrics = {
-            "request_count": 0,
-            "error_count": 0,
-            "total_response_time": 0.0,
-            "llm_call_count": 0,
-            "cache_hit_count": 0,
-            "cache_miss_count": 0,
-        }
-        self.operation_times = {}
+        with self._lock:
+            self.metrics = {
+                "request_count": 0,
+                "error_count": 0,
+                "total_response_time": 0.0,
+                "llm_call_count": 0,
+                "cache_hit_count": 0,
+                "cache_miss_count": 0,
+            }
+            self.operation_times = {}
 
 
 # Global monitor instance
@@ -168,36 +193,26 @@ def track_time(operation: str):
             ...
     """
     def decorator(func):
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            start = time.time()
-            try:
-                result = await func(*args, **kwargs)
-                duration = time.time() - start
-                _monitor.track_operation(operation, duration)
-                return result
-            except Exception as e:
-                duration = time.time() - start
-                _monitor.track_operation(operation, duration)
-                raise
+        # Build only the wrapper this function needs
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    _monitor.track_operation(operation, time.perf_counter() - start)
+
+            return async_wrapper
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            start = time.time()
+            start = time.perf_counter()
             try:
-                result = func(*args, **kwargs)
-                duration = time.time() - start
-                _monitor.track_operation(operation, duration)
-                return result
-            except Exception as e:
-                duration = time.time() - start
-                _monitor.track_operation(operation, duration)
-                raise
-
-        # Return appropriate wrapper based on function type
-        import inspect
-        if inspect.iscoroutinefunction(func):
-            return async_wrapper
+                return func(*args, **kwargs)
+            finally:
+                _monitor.track_operation(operation, time.perf_counter() - start)
+
         return sync_wrapper
 
     return decorator
@@ -211,7 +226,9 @@ def get_system_metrics() -> Dict[str, Any]:
         Dictionary of system metrics
     """
     try:
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        if psutil is None:
+            raise RuntimeError("psutil is not installed")
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage('/')
 
@@ -2,8 +2,8 @@
 Simplified Jinja2 Template Renderer
 Clean implementation focused on essential functionality
 """
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from typing import Dict, Any, List
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 from app.core.exceptions import TemplateError, TemplateNotFoundError
 from app.logger import get_logger
@@ -43,13 +43,36 @@ class SimpleTemplateRenderer:
         self.env.filters['limit_words'] = self._limit_words
         self.env.filters['ensure_period'] = self._ensure_period
     
-    def render(self, template_path: str, context: Dict[str, Any]) -> str:
+    def get_template(self, template_path: str) -> Template:
+        """
+        Get a compiled template from the environment's cache.
+        
+        Jinja keeps compiled templates (cache_size) and, with auto_reload,
+        recompiles a template whose file changed on disk.
+        
+        Args:
+            template_path: Path to template relative to template_dir
+            
+        Returns:
+            Compiled Jinja2 template
+        """
+        return self.env.get_template(template_path)
+    
+    def clear_cache(self) -> None:
+        """Drop compiled templates so every file is reloaded."""
+        if self.env.cache is not None:
+            self.env.cache.clear()
+    
+    def render(self, template_path: str, context: Dict[str, Any],
+               global_params: Optional[Dict[str, Any]] = None) -> str:
         """
         Render a template with context.
         
         Args:
             template_path: Path to template relative to template_dir
             context: Template variables
+            global_params: Optional values layered over context before
+                extracted values and generated content are applied
             
         Returns:
             Rendered template string
@@ -59,10 +82,10 @@ class SimpleTemplateRenderer:
             TemplateError: If rendering fails
         """
         try:
-            template = self.env.get_template(template_path)
+            template = self.get_template(template_path)
             
             # Flatten nested context for easier access in templates
-            flat_context = self._flatten_context(context)
+            flat_context = self._flatten_context(context, global_params)
             
             return template.render(flat_context)
             
@@ -71,9 +94,12 @@ class SimpleTemplateRenderer:
         except Exception as e:
             raise TemplateError(f"Failed to render {template_path}: {e}")
     
-    def _flatten_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _flatten_context(self, context: Dict[str, Any],
+                         global_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Flatten nested context for template access"""
         flat = dict(context)
+        if global_params:
+            flat.update(global_params)
         
         # Merge extracted values first, then allow generated content to override
         if 'extracted_values' in context and isinstance(context['extracted_values'], dict):
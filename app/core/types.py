@@ -127,6 +127,7 @@ class ValidationConstants:
     # Consistency thresholds
     TARGET_CV_PERCENTAGE = 15.0  # Target coefficient of variation
     MIN_STRUCTURAL_SCORE = 0.8  # Minimum structural consistency score
+    CONSISTENCY_HISTORY_SIZE = 1000  # Samples retained per document type
     
     # Content limits
     DEFAULT_MAX_WORDS = 30
@@ -156,6 +157,9 @@ class ProcessingConstants:
     DEFAULT_CHUNK_SIZE = 1024
     DEFAULT_CHUNK_OVERLAP = 128
     
+    # Approximate characters per streamed chunk (split on the next space)
+    STREAM_CHUNK_SIZE = 64
+    
     # Timeouts
     AGENT_TIMEOUT_SECONDS = 30
     EXTRACTION_TIMEOUT_SECONDS = 60
@@ -5,16 +5,23 @@ Single, simple implementation using only structured extraction with chain of tho
 Replaces 7 different extractors with one clean method.
 """
 
+import asyncio
 import json
 import os
 import re
-from typing import Any, Dict, Optional, Type, TypeVar
+import threading
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
 from pydantic import BaseModel
 
-from app.config import AZURE_OPENAI_CONFIG
+from app.config import AZURE_OPENAI_CONFIG, CACHE_CONFIG
 from app.core.extraction_models import KIExtractionSchema
 from app.core.exceptions import ExtractionError
+from app.core.llm_cache import (
+    cache_for_temperature, completion_cache_prompt, extraction_cache_prompt, get_cache
+)
+from app.core.llm_client import EXTRACTION_SYSTEM_PROMPT, EXTRACTION_USER_PREFIX, get_http_client
 from app.logger import get_logger
 from openai import AsyncAzureOpenAI
 
@@ -22,6 +29,36 @@ logger = get_logger(__name__)
 
 T = TypeVar('T', bound=BaseModel)
 
+# Offline extraction patterns, compiled once at import
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]\s+")
+_DURATION_PHRASE_RE = re.compile(
+    r"\b(\d+\s+(?:day|days|week|weeks|month|months|year|years))\b",
+    re.IGNORECASE,
+)
+_OFFLINE_SENTENCE_KEYWORDS = (
+    "study", "purpose", "goal", "will", "risk", "benefit",
+    "help", "alternative", "option", "blood", "sample",
+)
+
+
+@lru_cache(maxsize=64)
+def _system_message_for(output_schema: Type[BaseModel]) -> Dict[str, str]:
+    """
+    Build the extraction system message for a schema once.
+    
+    The schema lives in the system message and the document comes last, so
+    every request for a schema shares a byte-identical prefix that Azure
+    OpenAI can serve from its prompt cache. The dict is shared between
+    requests; the OpenAI SDK does not mutate messages.
+    """
+    return {
+        "role": "system",
+        "content": (
+            f"{EXTRACTION_SYSTEM_PROMPT}\n\n"
+            f"Return a JSON object matching this schema:\n{output_schema.model_json_schema()}"
+        ),
+    }
+
 
 def _parse_structured_fields(text: str) -> Dict[str, str]:
     """Parse simple KEY: value pairs from a document string."""
@@ -53,20 +90,25 @@ def _limit_words(text: str, max_words: int) -> str:
     return " ".join(words[:max_words]).strip()
 
 
-def _first_sentence_with_keyword(text: str, keyword: str) -> str:
-    sentences = re.split(r"[.!?]\s+", text)
-    for sentence in sentences:
-        if keyword.lower() in sentence.lower():
-            return sentence.strip()
-    return ""
+def _first_sentences_with_keywords(text: str, keywords: Tuple[str, ...]) -> Dict[str, str]:
+    """Map each lowercase keyword to the first sentence containing it, in one pass."""
+    found: Dict[str, str] = {}
+    pending = list(keywords)
+    for sentence in _SENTENCE_SPLIT_RE.split(text):
+        lowered = sentence.lower()
+        hits = [keyword for keyword in pending if keyword in lowered]
+        if hits:
+            stripped = sentence.strip()
+            for keyword in hits:
+                found[keyword] = stripped
+            pending = [keyword for keyword in pending if keyword not in found]
+            if not pending:
+                break
+    return found
 
 
 def _find_duration_phrase(text: str) -> str:
-    match = re.search(
-        r"\b(\d+\s+(?:day|days|week|weeks|month|months|year|years))\b",
-        text,
-        flags=re.IGNORECASE,
-    )
+    match = _DURATION_PHRASE_RE.search(text)
     if match:
         return match.group(1).lower()
     return ""
@@ -78,6 +120,8 @@ def _offline_ki_payload(document: str) -> Dict[str, Any]:
     """
     fields = _parse_structured_fields(document)
     lower_doc = document.lower()
+    # Split and scan the document once for every fallback keyword
+    sentences = _first_sentences_with_keywords(document, _OFFLINE_SENTENCE_KEYWORDS)
 
     def normalized(key: str, default: str = "") -> str:
         value = fields.get(key)
@@ -113,7 +157,7 @@ def _offline_ki_payload(document: str) -> Dict[str, Any]:
 
     study_object = normalized("study_object", "")
     if not study_object:
-        sentence = _first_sentence_with_keyword(document, "study")
+        sentence = sentences.get("study", "")
         if sentence:
             study_object = _limit_words(sentence, 6).lower()
         if not study_object:
@@ -121,7 +165,7 @@ def _offline_ki_payload(document: str) -> Dict[str, Any]:
 
     study_purpose = normalized("study_purpose", "")
     if not study_purpose:
-        purpose_sentence = _first_sentence_with_keyword(document, "purpose") or _first_sentence_with_keyword(document, "goal")
+        purpose_sentence = sentences.get("purpose", "") or sentences.get("goal", "")
         if purpose_sentence:
             study_purpose = _limit_words(purpose_sentence, 15)
         if not study_purpose:
@@ -129,7 +173,7 @@ def _offline_ki_payload(document: str) -> Dict[str, Any]:
 
     study_goals = normalized("study_goals", "")
     if not study_goals:
-        goals_sentence = _first_sentence_with_keyword(document, "goal") or _first_sentence_with_keyword(document, "will")
+        goals_sentence = sentences.get("goal", "") or sentences.get("will", "")
         if goals_sentence:
             study_goals = _limit_words(goals_sentence, 15)
         if not study_goals:
@@ -137,7 +181,7 @@ def _offline_ki_payload(document: str) -> Dict[str, Any]:
 
     key_risks = normalized("key_risks", "")
     if not key_risks:
-        risk_sentence = _first_sentence_with_keyword(document, "risk")
+        risk_sentence = sentences.get("risk", "")
         if risk_sentence:
             key_risks = _limit_words(risk_sentence, 20)
         if not key_risks:
@@ -149,7 +193,7 @@ def _offline_ki_payload(document: str) -> Dict[str, Any]:
 
     benefit_description = normalized("benefit_description", "")
     if not benefit_description:
-        benefit_sentence = _first_sentence_with_keyword(document, "benefit") or _first_sentence_with_keyword(document, "help")
+        benefit_sentence = sentences.get("benefit", "") or sentences.get("help", "")
         if benefit_sentence:
             benefit_description = _limit_words(benefit_sentence, 15)
         if not benefit_description:
@@ -175,7 +219,7 @@ def _offline_ki_payload(document: str) -> Dict[str, Any]:
 
     alternative_options = normalized("alternative_options", "")
     if not alternative_options and affects_treatment:
-        alt_sentence = _first_sentence_with_keyword(document, "alternative") or _first_sentence_with_keyword(document, "option")
+        alt_sentence = sentences.get("alternative", "") or sentences.get("option", "")
         if alt_sentence:
             alternative_options = _limit_words(alt_sentence, 15)
         if not alternative_options:
@@ -187,7 +231,7 @@ def _offline_ki_payload(document: str) -> Dict[str, Any]:
 
     biospecimen_details = normalized("biospecimen_details", "")
     if (not biospecimen_details) and collects_biospecimens:
-        bio_sentence = _first_sentence_with_keyword(document, "blood") or _first_sentence_with_keyword(document, "sample")
+        bio_sentence = sentences.get("blood", "") or sentences.get("sample", "")
         if bio_sentence:
             biospecimen_details = _limit_words(bio_sentence, 15)
         if not biospecimen_details:
@@ -265,14 +309,28 @@ class UnifiedExtractor:
 
         self.model = AZURE_OPENAI_CONFIG.get("deployment_name", "gpt-4")
         self.temperature = AZURE_OPENAI_CONFIG.get("temperature", 0.0)
+        self.cache = self._create_cache() if not self.offline_mode else None
+
+    def _create_cache(self):
+        """Get the shared LLM response cache, or None if disabled"""
+        if not CACHE_CONFIG["enabled"]:
+            return None
+        return get_cache(
+            ttl_seconds=CACHE_CONFIG["ttl_seconds"],
+            max_size=CACHE_CONFIG["max_size"],
+            backing_path=CACHE_CONFIG["backing_path"]
+        )
 
     def _create_default_client(self) -> AsyncAzureOpenAI:
         """Create default Azure OpenAI client from config"""
+        # Every agent's extractor shares one connection pool
         return AsyncAzureOpenAI(
             api_key=AZURE_OPENAI_CONFIG["api_key"],
             api_version=AZURE_OPENAI_CONFIG["api_version"],
             azure_endpoint=AZURE_OPENAI_CONFIG["endpoint"],
             default_headers=AZURE_OPENAI_CONFIG.get("default_headers", {}),
+            http_client=get_http_client(),
+            max_retries=AZURE_OPENAI_CONFIG["max_retries"],
         )
 
     async def extract(self, document: str, output_schema: Type[T]) -> T:
@@ -292,24 +350,20 @@ class UnifiedExtractor:
                 return output_schema(**payload)
             raise NotImplementedError("Offline extraction currently supports only KIExtractionSchema")
 
-        system_prompt = (
-            "You are an expert at extracting structured information from documents.\n"
-            "Use chain of thought reasoning:\n"
-            "1. First, identify the relevant sections in the document\n"
-            "2. Extract the requested information accurately\n"
-            "3. Verify the extracted values make sense in context\n"
-            "4. Return the structured output matching the schema\n\n"
-            "Think step-by-step internally, but only return the final structured output."
-        )
-
+        system_message = _system_message_for(output_schema)
         messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": f"Extract information from this document:\n\n{document}"},
+            system_message,
+            {"role": "user", "content": EXTRACTION_USER_PREFIX + document},
         ]
 
         try:
-            schema_prompt = f"\n\nReturn a JSON object matching this schema:\n{output_schema.model_json_schema()}"
-            messages[-1]["content"] += schema_prompt
+            # Deterministic calls reuse the already-validated result
+            cache = cache_for_temperature(self.cache, self.temperature)
+            cache_prompt = extraction_cache_prompt(system_message["content"], messages[-1]["content"])
+            if cache:
+                cached = cache.get_parsed(cache_prompt, self.model, self.temperature, output_schema)
+                if cached is not None:
+                    return cached
 
             response = await self.llm_client.chat.completions.create(
                 model=self.model,
@@ -319,17 +373,49 @@ class UnifiedExtractor:
                 timeout=60,
             )
 
-            content = response.choices[0].message.content
-            result_dict = json.loads(content)
-            result = output_schema(**result_dict)
+            # Parse and validate in one pass inside pydantic-core
+            result = output_schema.model_validate_json(response.choices[0].message.content)
 
             logger.info(f"Successfully extracted {output_schema.__name__}")
+            if cache:
+                cache.set_parsed(cache_prompt, self.model, self.temperature, result)
             return result
 
         except Exception as e:
             logger.error(f"Extraction failed: {e}")
             raise
 
+    async def extract_many(
+        self,
+        documents: List[str],
+        output_schema: Type[T],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Union[T, Exception]]:
+        """
+        Extract the same schema from several documents concurrently.
+
+        Args:
+            documents: Document texts to extract from
+            output_schema: Pydantic model defining the output structure
+            max_concurrency: Requests in flight at once (default from config)
+
+        Returns:
+            Results in document order; a failed document yields its exception
+            instead of cancelling the rest
+        """
+        semaphore = asyncio.Semaphore(
+            max_concurrency or AZURE_OPENAI_CONFIG["max_concurrent_requests"]
+        )
+
+        async def run(document: str) -> T:
+            async with semaphore:
+                return await self.extract(document, output_schema)
+
+        return await asyncio.gather(
+            *(run(document) for document in documents),
+            return_exceptions=True
+        )
+
     async def complete(
         self,
         prompt: str,
@@ -357,18 +443,103 @@ class UnifiedExtractor:
                     ) from e
             return json.dumps(_offline_polished_values(values))
 
+        request, cache_prompt = self._completion_request(prompt, system_prompt, max_tokens, kwargs)
+        cache = cache_for_temperature(self.cache, request["temperature"])
+        if cache:
+            cached = cache.get(cache_prompt, self.model, request["temperature"])
+            if cached is not None:
+                return cached
+
+        response = await self.llm_client.chat.completions.create(**request)
+        content = response.choices[0].message.content
+        if cache and content is not None:
+            cache.set(cache_prompt, self.model, request["temperature"], content)
+        return content
+
+    async def complete_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 400,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion as it is generated.
+
+        Offline mode and cache hits yield the whole text in one piece.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            max_tokens: Maximum response tokens
+
+        Yields:
+            Text fragments in generation order
+        """
+        if self.offline_mode:
+            yield await self.complete(prompt, system_prompt, max_tokens, **kwargs)
+            return
+
+        request, cache_prompt = self._completion_request(prompt, system_prompt, max_tokens, kwargs)
+        cache = cache_for_temperature(self.cache, request["temperature"])
+        if cache:
+            cached = cache.get(cache_prompt, self.model, request["temperature"])
+            if cached is not None:
+                yield cached
+                return
+
+        parts = []
+        stream = await self.llm_client.chat.completions.create(**request, stream=True)
+        async for chunk in stream:
+            # Azure sends a leading chunk with no choices for content filtering
+            if not chunk.choices:
+                continue
+            text = chunk.choices[0].delta.content
+            if text:
+                parts.append(text)
+                yield text
+
+        if cache and parts:
+            cache.set(cache_prompt, self.model, request["temperature"], "".join(parts))
+
+    def _completion_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Dict[str, Any], str]:
+        """Build chat completion arguments and the matching cache prompt"""
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        temperature = kwargs.get("temperature", self.temperature)
         requested_max_tokens = kwargs.get("max_tokens", max_tokens)
+        request = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": kwargs.get("temperature", self.temperature),
+            "max_tokens": requested_max_tokens,
+        }
+        return request, completion_cache_prompt(system_prompt, prompt, requested_max_tokens)
 
-        response = await self.llm_client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=requested_max_tokens,
-        )
-        return response.choices[0].message.content
+
+# Global extractor instance shared by plugin agents
+_extractor: Optional[UnifiedExtractor] = None
+_extractor_lock = threading.Lock()
+
+
+def get_unified_extractor() -> UnifiedExtractor:
+    """
+    Get the global UnifiedExtractor instance.
+
+    Returns:
+        Shared UnifiedExtractor using the default Azure OpenAI client
+    """
+    global _extractor
+    if _extractor is None:
+        with _extractor_lock:
+            if _extractor is None:
+                _extractor = UnifiedExtractor()
+    return _extractor
@@ -13,10 +13,73 @@ from typing import Optional, Any, Union, Dict, Callable, TypeVar, Type
 import json
 import numpy as np
 from datetime import datetime
+from functools import lru_cache
 from pydantic import BaseModel
+from app.logger import get_logger
+
+logger = get_logger("core.utils")
 
 T = TypeVar('T')
 
+try:
+    import tiktoken
+except ImportError:  # Optional; falls back to a character budget
+    tiktoken = None
+
+# Rough characters per token, used when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """
+    Get the tokenizer for a model, defaulting to the GPT-4o encoding.
+    
+    Returns:
+        The tiktoken encoding, or None if it could not be loaded. tiktoken
+        downloads encoding files on first use, so a network failure is
+        remembered rather than retried on every call.
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Azure deployment names need not match an OpenAI model name
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"Tokenizer unavailable, using a character budget: {e}")
+        return None
+
+
+def truncate_to_token_budget(text: str, max_tokens: int, model: str) -> str:
+    """
+    Truncate text to at most max_tokens tokens for the given model.
+    
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+        model: Model or deployment name used to pick the tokenizer
+        
+    Returns:
+        The text, cut at a token boundary if it exceeds the budget
+    """
+    # UTF-8 is at most 4 bytes per character and every token covers at
+    # least one byte, so short inputs cannot exceed the budget
+    if len(text) * 4 <= max_tokens:
+        return text
+    encoding = _get_encoding(model) if tiktoken is not None else None
+    if encoding is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    
+    # Tokens rarely span more than a few characters, so encoding a bounded
+    # prefix keeps the cost proportional to the budget, not the document.
+    # Special-token strings such as <|endoftext|> are document text here.
+    prefix = text[:max_tokens * 8]
+    tokens = encoding.encode(prefix, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return prefix
+    return encoding.decode(tokens[:max_tokens])
+
 
 class TextProcessingUtils:
     """Utilities for text processing and manipulation."""
@@ -383,10 +446,32 @@ class JSONUtils:
         Returns:
             Extracted JSON dict or None
         """
-        # Try to find JSON object in text
-        match = re.search(r'\{[\s\S]*\}', text)
-        if match:
-            return JSONUtils.safe_parse(match.group(0))
+        # Scan once for the first balanced {...}, skipping braces inside strings;
+        # a greedy regex would backtrack and could swallow trailing objects
+        start = text.find("{")
+        if start < 0:
+            return None
+        
+        depth = 0
+        in_string = False
+        escaped = False
+        for i in range(start, len(text)):
+            char = text[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    return JSONUtils.safe_parse(text[start:i + 1])
         return None
     
     @staticmethod
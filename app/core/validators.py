@@ -5,17 +5,23 @@ This module provides focused validator classes following the Single Responsibili
 replacing the monolithic EnhancedValidationOrchestrator.
 """
 
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 import re
 import hashlib
+import threading
 import numpy as np
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
 
 from .exceptions import ValidationError
 from .plugin_manager import ValidationRuleSet
-from .types import ValidationResult, ConsistencyThresholds
+from .types import ValidationResult, ConsistencyThresholds, ValidationConstants
+
+_SECTION_HEADING_RE = re.compile(r'^Section \d+', re.MULTILINE)
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+# First character of each sentence, using the same boundaries as the split
+_SENTENCE_START_RE = re.compile(r'(?:\A|[.!?]+)\s*([^\s.!?])')
 
 
 @dataclass
@@ -26,6 +32,7 @@ class ValidationContext:
     rules: ValidationRuleSet
     critical_values: list[str]
     document_type: str = "default"
+    rendered_lower: Optional[str] = None
     results: dict[str, Any] = field(default_factory=lambda: {
         "passed": True,
         "issues": [],
@@ -34,6 +41,11 @@ class ValidationContext:
         "consistency_metrics": {},
         "content_analysis": {}
     })
+    
+    def __post_init__(self):
+        # Lowercase once so every validator shares the same copy
+        if self.rendered_lower is None:
+            self.rendered_lower = self.rendered.lower()
 
 
 class BaseValidator(ABC):
@@ -129,6 +141,7 @@ class ContentQualityValidator(BaseValidator):
     def __init__(self, prohibited_phrases: Optional[list[str]] = None):
         """Initialize with optional custom prohibited phrases."""
         self.prohibited_phrases = prohibited_phrases or self.PROHIBITED_PHRASES
+        self._lowered_phrases = [(phrase, phrase.lower()) for phrase in self.prohibited_phrases]
     
     def validate(self, context: ValidationContext) -> ValidationContext:
         """Check content quality including prohibited phrases and sentence structure."""
@@ -139,39 +152,45 @@ class ContentQualityValidator(BaseValidator):
     
     def _check_prohibited_phrases(self, context: ValidationContext) -> None:
         """Check for prohibited phrases that indicate LLM artifacts."""
-        found_phrases = []
-        rendered_lower = context.rendered.lower()
-        
-        for phrase in self.prohibited_phrases:
-            if phrase.lower() in rendered_lower:
-                found_phrases.append(phrase)
+        rendered_lower = context.rendered_lower
+        found_phrases = [
+            phrase for phrase, phrase_lower in self._lowered_phrases
+            if phrase_lower in rendered_lower
+        ]
         
         if found_phrases:
             self.add_issue(context, f"Prohibited phrases found: {', '.join(found_phrases)}")
     
     def _check_sentence_quality(self, context: ValidationContext) -> None:
         """Check sentence structure and quality."""
-        sentences = re.split(r'[.!?]+', context.rendered)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        rendered = context.rendered
+        sentences = [s for s in (part.strip() for part in _SENTENCE_SPLIT_RE.split(rendered)) if s]
         
-        issues: Set[str] = set()
+        issues: list[str] = []
         
-        for sentence in sentences:
-            # Check for sentences starting with lowercase
-            if sentence and not sentence[0].isupper() and not sentence[0].isdigit():
-                issues.add("Sentence starting with lowercase")
-            
+        # Flag any sentence not starting with an uppercase letter or a digit,
+        # including quotes, brackets and non-ASCII lowercase letters
+        if any(
+            not first.isupper() and not first.isdigit()
+            for first in (match.group(1) for match in _SENTENCE_START_RE.finditer(rendered))
+        ):
+            issues.append("Sentence starting with lowercase")
+        
+        if sentences:
+            word_counts = np.fromiter(
+                (len(sentence.split()) for sentence in sentences),
+                dtype=np.int32,
+                count=len(sentences)
+            )
             # Check for very short sentences (likely fragments)
-            word_count = len(sentence.split())
-            if word_count < 3:
-                issues.add("Very short sentence fragment")
-            
+            if np.any(word_counts < 3):
+                issues.append("Very short sentence fragment")
             # Check for very long sentences
-            if word_count > 50:
-                issues.add("Excessively long sentence")
+            if np.any(word_counts > 50):
+                issues.append("Excessively long sentence")
         
-        # Add unique issues as warnings (limit to 3)
-        for issue in list(issues)[:3]:
+        # Add unique issues as warnings
+        for issue in issues:
             self.add_warning(context, issue)
         
         context.results["content_analysis"]["sentence_count"] = len(sentences)
@@ -200,8 +219,14 @@ class StructuralValidator(BaseValidator):
     
     def _check_section_structure(self, context: ValidationContext) -> None:
         """Check for consistent section markers."""
-        sections = re.findall(r'^Section \d+', context.rendered, re.MULTILINE)
-        
+        rendered = context.rendered
+        # Cheap substring precheck skips the regex for documents without
+        # headings; a matching raw count can still hide duplicated or
+        # non-numeric headings, so only unique numbered matches decide
+        if not rendered.startswith('Section ') and '\nSection ' not in rendered:
+            return
+
+        sections = _SECTION_HEADING_RE.findall(rendered)
         if sections:
             unique_sections = len(set(sections))
             if unique_sections != self.expected_sections:
@@ -213,14 +238,23 @@ class StructuralValidator(BaseValidator):
     
     def _check_paragraph_consistency(self, context: ValidationContext) -> None:
         """Check paragraph structure consistency."""
-        paragraphs = context.rendered.split('\n\n')
-        paragraph_lengths = [len(p.split()) for p in paragraphs if p.strip()]
-        
-        if paragraph_lengths:
-            avg_length = np.mean(paragraph_lengths)
-            std_length = np.std(paragraph_lengths)
-            cv = (std_length / avg_length * 100) if avg_length > 0 else 0
-            
+        # Single pass over paragraphs accumulating count, sum and sum of squares
+        count = 0
+        total = 0
+        total_sq = 0
+        for paragraph in context.rendered.split('\n\n'):
+            length = len(paragraph.split())
+            if length == 0:
+                continue
+            count += 1
+            total += length
+            total_sq += length * length
+
+        if count:
+            avg_length = total / count
+            variance = max(total_sq / count - avg_length * avg_length, 0.0)
+            cv = (variance ** 0.5 / avg_length * 100) if avg_length > 0 else 0
+
             context.results["content_analysis"]["paragraph_cv"] = cv
             if cv > 50:  # High variability
                 self.add_info(context, f"High paragraph length variability: CV={cv:.1f}%")
@@ -263,26 +297,58 @@ class CriticalValueValidator(BaseValidator):
 @dataclass
 class ConsistencyMetrics:
     """Track consistency metrics across multiple runs."""
-    word_counts: list[int] = field(default_factory=list)
-    sentence_counts: list[int] = field(default_factory=list)
-    content_hashes: list[str] = field(default_factory=list)
+    # Recent hashes only; word count stats live in the running state below
+    content_hashes: deque[str] = field(default_factory=lambda: deque(maxlen=ValidationConstants.CONSISTENCY_HISTORY_SIZE))
+    # Occurrences of each hash within content_hashes, for O(1) unique counts
+    hash_counts: Counter = field(default_factory=Counter)
+    # Welford running state for word counts, so stats are O(1) per read
+    word_count_runs: int = 0
+    word_count_mean: float = 0.0
+    word_count_m2: float = 0.0
+    # Last metrics snapshot, rebuilt only after new data arrives
+    cached_metrics: Optional[dict[str, Any]] = field(default=None, repr=False)
+    dirty: bool = True
+    
+    def add_content_hash(self, content_hash: str) -> None:
+        """Record a content hash, keeping the windowed hash counts in step."""
+        if len(self.content_hashes) == self.content_hashes.maxlen:
+            evicted = self.content_hashes[0]
+            self.hash_counts[evicted] -= 1
+            if not self.hash_counts[evicted]:
+                del self.hash_counts[evicted]
+        self.content_hashes.append(content_hash)
+        self.hash_counts[content_hash] += 1
+        self.dirty = True
+    
+    def add_word_count(self, word_count: int) -> None:
+        """Record a word count and update the running mean and M2."""
+        self.word_count_runs += 1
+        delta = word_count - self.word_count_mean
+        self.word_count_mean += delta / self.word_count_runs
+        self.word_count_m2 += delta * (word_count - self.word_count_mean)
+        self.dirty = True
+    
+    def word_count_std(self) -> float:
+        """Population standard deviation of recorded word counts."""
+        if self.word_count_runs == 0:
+            return 0.0
+        return (self.word_count_m2 / self.word_count_runs) ** 0.5
     
     def calculate_coefficient_of_variation(self) -> float:
         """Calculate coefficient of variation for word counts."""
-        if len(self.word_counts) < 2:
+        if self.word_count_runs < 2:
             return 0.0
-        mean_count = np.mean(self.word_counts)
+        mean_count = self.word_count_mean
         if mean_count == 0:
             return 0.0
-        std_count = np.std(self.word_counts)
-        return (std_count / mean_count) * 100
+        return (self.word_count_std() / mean_count) * 100
     
     def calculate_structural_consistency(self) -> float:
-        """Calculate structural consistency based on content hashes."""
-        if len(self.content_hashes) < 2:
+        """Calculate structural consistency based on recent content hashes."""
+        window = len(self.content_hashes)
+        if window < 2:
             return 1.0
-        unique_hashes = len(set(self.content_hashes))
-        return 1.0 - (unique_hashes - 1) / len(self.content_hashes)
+        return 1.0 - (len(self.hash_counts) - 1) / window
 
 
 class ConsistencyTracker:
@@ -291,45 +357,59 @@ class ConsistencyTracker:
     def __init__(self):
         """Initialize consistency tracker."""
         self.metrics_by_type = defaultdict(ConsistencyMetrics)
+        # Validation may run in worker threads; guards the running metric state
+        self._lock = threading.Lock()
     
-    def track(self, rendered: str, document_type: str) -> None:
-        """Track metrics for consistency analysis."""
-        metrics = self.metrics_by_type[document_type]
-        
-        # Track content hash
-        content_hash = hashlib.md5(rendered.encode()).hexdigest()[:8]
-        metrics.content_hashes.append(content_hash)
+    def track(self,
+              rendered: str,
+              document_type: str,
+              word_count: Optional[int] = None) -> None:
+        """
+        Track metrics for consistency analysis.
         
-        # Track word count
-        word_count = len(rendered.split())
-        metrics.word_counts.append(word_count)
+        Args:
+            rendered: Rendered document content
+            document_type: Type of document being tracked
+            word_count: Pre-computed word count, to avoid re-splitting
+        """
+        # Measure outside the lock; only the bookkeeping is serialized
+        content_hash = hashlib.md5(rendered.encode('utf-8')).hexdigest()[:8]
+        if word_count is None:
+            word_count = len(rendered.split())
         
-        # Track sentence count
-        sentence_count = len(re.split(r'[.!?]+', rendered))
-        metrics.sentence_counts.append(sentence_count)
+        with self._lock:
+            metrics = self.metrics_by_type[document_type]
+            metrics.add_content_hash(content_hash)
+            metrics.add_word_count(word_count)
     
     def get_metrics(self, document_type: str) -> dict[str, Any]:
         """Get consistency metrics for a document type."""
-        metrics = self.metrics_by_type[document_type]
+        with self._lock:
+            metrics = self.metrics_by_type[document_type]
         
-        if len(metrics.word_counts) < 2:
-            return {
-                "runs_analyzed": len(metrics.word_counts),
-                "insufficient_data": True
-            }
+            if not metrics.dirty and metrics.cached_metrics is not None:
+                return dict(metrics.cached_metrics)
         
-        cv = metrics.calculate_coefficient_of_variation()
-        structural = metrics.calculate_structural_consistency()
+            if metrics.word_count_runs < 2:
+                snapshot = {
+                    "runs_analyzed": metrics.word_count_runs,
+                    "insufficient_data": True
+                }
+            else:
+                cv = metrics.calculate_coefficient_of_variation()
+                snapshot = {
+                    "runs_analyzed": metrics.word_count_runs,
+                    "coefficient_of_variation": cv,
+                    "structural_consistency": metrics.calculate_structural_consistency(),
+                    "mean_word_count": metrics.word_count_mean,
+                    "std_word_count": metrics.word_count_std(),
+                    "unique_outputs": len(metrics.hash_counts),
+                    "target_achieved": cv < 15.0  # Target CV < 15%
+                }
         
-        return {
-            "runs_analyzed": len(metrics.word_counts),
-            "coefficient_of_variation": cv,
-            "structural_consistency": structural,
-            "mean_word_count": np.mean(metrics.word_counts),
-            "std_word_count": np.std(metrics.word_counts),
-            "unique_outputs": len(set(metrics.content_hashes)),
-            "target_achieved": cv < 15.0  # Target CV < 15%
-        }
+            metrics.cached_metrics = snapshot
+            metrics.dirty = False
+            return dict(snapshot)
     
     def get_report(self, document_type: Optional[str] = None) -> dict[str, Any]:
         """Generate comprehensive consistency report."""
@@ -338,25 +418,32 @@ class ConsistencyTracker:
             "by_document_type": {}
         }
         
-        types = [document_type] if document_type else list(self.metrics_by_type.keys())
-        
-        for doc_type in types:
-            metrics = self.metrics_by_type[doc_type]
-            if len(metrics.word_counts) > 0:
-                report["by_document_type"][doc_type] = {
-                    "runs": len(metrics.word_counts),
+        with self._lock:
+            if document_type:
+                # Avoid creating an empty entry through the defaultdict
+                selected = [(document_type, self.metrics_by_type.get(document_type))]
+            else:
+                selected = list(self.metrics_by_type.items())
+            
+            by_type = {
+                doc_type: {
+                    "runs": metrics.word_count_runs,
                     "cv": metrics.calculate_coefficient_of_variation(),
                     "structural_consistency": metrics.calculate_structural_consistency(),
-                    "mean_word_count": np.mean(metrics.word_counts),
-                    "unique_outputs": len(set(metrics.content_hashes))
+                    "mean_word_count": metrics.word_count_mean,
+                    "unique_outputs": len(metrics.hash_counts)
                 }
+                for doc_type, metrics in selected
+                if metrics is not None and metrics.word_count_runs > 0
+            }
+        report["by_document_type"] = by_type
         
-        # Calculate overall metrics
-        all_cvs = [m["cv"] for m in report["by_document_type"].values()]
+        # Calculate overall metrics; the type count is small, so plain sums suffice
+        all_cvs = [m["cv"] for m in by_type.values()]
         if all_cvs:
             report["overall_metrics"] = {
-                "mean_cv": np.mean(all_cvs),
-                "meets_target": all(cv < 15.0 for cv in all_cvs)
+                "mean_cv": sum(all_cvs) / len(all_cvs),
+                "meets_target": max(all_cvs) < 15.0
             }
         
         return report
@@ -421,8 +508,12 @@ class ValidationOrchestrator:
         for validator in self.validators:
             context = validator.validate(context)
         
-        # Track consistency metrics
-        self.consistency_tracker.track(rendered, document_type)
+        # Track consistency metrics, reusing the word count from content analysis
+        self.consistency_tracker.track(
+            rendered,
+            document_type,
+            word_count=context.results["content_analysis"].get("word_count")
+        )
         
         # Add consistency metrics to results
         context.results["consistency_metrics"] = self.consistency_tracker.get_metrics(document_type)
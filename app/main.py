@@ -1,6 +1,7 @@
 import io
 import logging
 import re
+from contextlib import asynccontextmanager
 from typing import Union, Optional, Dict, Any, List
 
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException
@@ -23,7 +24,15 @@ def convert_section(text):
     else:
         raise ValueError("Input string does not match the pattern 'section[0-9]+'")
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Flush the LLM cache's on-disk store, if any, when the server stops."""
+    yield
+    from .core.llm_cache import close_cache
+    close_cache()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Configure CORS using centralized AppConfig
 app.add_middleware(
@@ -6,10 +6,11 @@ import re
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from app.core.plugin_manager import DocumentPlugin, TemplateCatalog, ValidationRuleSet, TemplateSlot, SlotType
-from app.core.unified_extractor import UnifiedExtractor
+from app.core.unified_extractor import get_unified_extractor
 from app.core.agent_interfaces import BaseAgent, AgentRole, AgentContext
 from app.core.exceptions import ExtractionError
 from app.core.extraction_models import KIExtractionSchema, ExtractionReasoning, ReasoningStep
+from app.core.utils import JSONUtils, truncate_to_token_budget
 from app.config import TEXT_PROCESSING
 from app.logger import get_logger
 
@@ -17,21 +18,24 @@ from app.logger import get_logger
 logger = get_logger("plugins.informed_consent")
 
 _TRAILING_CHARS = " .;:,!?\"'"
+_WHITESPACE_RE = re.compile(r"\s+")
+_FIRST_LETTER_RE = re.compile(r"[A-Za-z]")
+_LEADING_WORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9'/-]*")
 
 
 def _normalize_clause(value: Optional[str], *, lower_leading: bool = False) -> str:
     """Collapse whitespace, trim trailing punctuation, and optionally downcase the leading word."""
     if not value:
         return ""
-    cleaned = re.sub(r"\s+", " ", value.strip())
+    cleaned = _WHITESPACE_RE.sub(" ", value.strip())
     while cleaned and cleaned[-1] in _TRAILING_CHARS:
         cleaned = cleaned[:-1]
 
     if lower_leading and cleaned:
-        letter_match = re.search(r"[A-Za-z]", cleaned)
+        letter_match = _FIRST_LETTER_RE.search(cleaned)
         if letter_match:
             idx = letter_match.start()
-            word_match = re.match(r"[A-Za-z][A-Za-z0-9'/-]*", cleaned[idx:])
+            word_match = _LEADING_WORD_RE.match(cleaned, idx)
             if word_match:
                 word = word_match.group(0)
                 if not word.isupper():
@@ -204,7 +208,7 @@ class KIExtractionAgent(BaseAgent):
         
         # Initialize chain-of-thought extractor
         try:
-            self.extractor = UnifiedExtractor()
+            self.extractor = get_unified_extractor()
             logger.info("Unified extractor initialized")
         except Exception as e:
             logger.error(f"Failed to initialize chain-of-thought extraction: {e}")
@@ -351,7 +355,7 @@ class KINaturalizationAgent(BaseAgent):
 
     def __init__(self):
         super().__init__("KINaturalizationAgent", AgentRole.GENERATOR)
-        self.extractor = UnifiedExtractor()
+        self.extractor = get_unified_extractor()
 
     async def process(self, agent_context: AgentContext) -> Dict[str, Any]:
         self.context = agent_context
@@ -370,6 +374,14 @@ class KINaturalizationAgent(BaseAgent):
         elif 'document_text' in params:
             document_context = params['document_text']
 
+        # With neither extracted values nor source text there is nothing the
+        # LLM could fill in; otherwise it still recovers slots from the excerpt
+        # when extraction failed upstream
+        if not extracted and not document_context:
+            generated["biospecimen_statement"] = ""
+            agent_context.generated_content = generated
+            return {"generated_content": generated}
+
         # Build a prompt to naturalize slots with structured reasoning
         import json
         system_prompt = (
@@ -395,8 +407,10 @@ class KINaturalizationAgent(BaseAgent):
 
         # Provide both doc context and the raw extracted values as source material.
         user_prompt = (
-            "Document excerpt:\n" + (document_context[:6000] if document_context else "") +
-            "\n\nExtracted values (JSON):\n" + json.dumps(extracted, ensure_ascii=False) +
+            "Document excerpt:\n" + truncate_to_token_budget(
+                document_context or "", TEXT_PROCESSING["naturalization_input_tokens"], self.extractor.model
+            ) +
+            "\n\nExtracted values (JSON):\n" + json.dumps(extracted, ensure_ascii=False, separators=(",", ":")) +
             "\n\nReturn JSON with keys: study_purpose, study_goals, biospecimen_statement, study_duration, key_risks, benefit_description."
         )
 
@@ -412,9 +426,7 @@ class KINaturalizationAgent(BaseAgent):
             try:
                 polished = json.loads(response)
             except json.JSONDecodeError:
-                import re
-                m = re.search(r"\{[\s\S]*\}", response)
-                polished = json.loads(m.group(0)) if m else {}
+                polished = JSONUtils.extract_json_from_text(response) or {}
         except (json.JSONDecodeError, AttributeError):
             # If all JSON parsing attempts fail, use empty dict
             polished = {}
@@ -0,0 +1,60 @@
+"""
+Tests for inter-agent messaging on the shared AgentContext.
+"""
+import pytest
+
+from app.core.agent_interfaces import AgentContext, AgentMessage, AgentRole, BaseAgent
+
+
+class EchoAgent(BaseAgent):
+    """Minimal agent used to exercise the messaging helpers"""
+
+    async def process(self, context: AgentContext):
+        return {}
+
+
+def make_message(recipient: str, content: str) -> AgentMessage:
+    return AgentMessage(sender="test", recipient=recipient, content=content, message_type="info")
+
+
+class TestAgentMessaging:
+    """Test per-recipient message delivery"""
+
+    def test_agents_receive_only_their_messages_in_order(self):
+        """Test each agent sees its own messages in send order"""
+        context = AgentContext(document_type="informed-consent", parameters={})
+        sender = EchoAgent("Sender", AgentRole.EXTRACTOR)
+        sender.context = context
+        sender.send_message("A", "first")
+        sender.send_message("B", "other")
+        sender.send_message("A", "second")
+
+        receiver = EchoAgent("A", AgentRole.GENERATOR)
+        receiver.context = context
+        assert [msg.content for msg in receiver.receive_messages()] == ["first", "second"]
+        assert len(context.messages) == 3
+
+    def test_clear_removes_only_recipient_messages(self):
+        """Test clearing one inbox keeps the rest of the message log"""
+        context = AgentContext(document_type="informed-consent", parameters={})
+        context.add_message(make_message("A", "one"))
+        context.add_message(make_message("B", "two"))
+
+        context.clear_messages_for("A")
+
+        assert context.get_messages_for("A") == []
+        assert [msg.content for msg in context.get_messages_for("B")] == ["two"]
+        assert [msg.recipient for msg in context.messages] == ["B"]
+
+    def test_initial_messages_are_indexed(self):
+        """Test messages passed to the constructor are delivered"""
+        context = AgentContext(
+            document_type="informed-consent",
+            parameters={},
+            messages=[make_message("A", "seeded")],
+        )
+        assert [msg.content for msg in context.get_messages_for("A")] == ["seeded"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,64 @@
+"""
+Tests for the simplified document processing pipeline.
+"""
+import asyncio
+
+import pytest
+
+from app.core.document_processor import SimpleDocumentProcessor
+from app.core.extraction_models import KIExtractionSchema
+
+
+class TestSimpleDocumentProcessor:
+    """Test SimpleDocumentProcessor extraction behaviour"""
+
+    def test_concurrent_identical_documents_share_one_extraction(self, sample_document):
+        """Test concurrent requests for the same document issue one extractor call"""
+        processor = SimpleDocumentProcessor()
+        real_extract = processor.extractor.extract
+        calls = []
+
+        async def counting_extract(document, output_schema):
+            calls.append(document)
+            await asyncio.sleep(0.01)
+            return await real_extract(document=document, output_schema=output_schema)
+
+        processor.extractor.extract = counting_extract
+
+        async def run():
+            return await asyncio.gather(*[
+                processor.process(
+                    document_text=sample_document.text,
+                    document_type="informed-consent",
+                    output_schema=KIExtractionSchema
+                )
+                for _ in range(3)
+            ])
+
+        contexts = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert all(c.extracted_values == contexts[0].extracted_values for c in contexts)
+        assert contexts[0].extracted_values is not contexts[1].extracted_values
+        assert processor._inflight_extractions == {}
+
+    def test_validate_checks_values_not_dict_repr(self):
+        """Test multi-line critical values are found in the validated text"""
+        from app.core.document_processor import ProcessingContext
+
+        processor = SimpleDocumentProcessor()
+        context = ProcessingContext(
+            document_text="",
+            document_type="informed-consent",
+            extracted_values={"key_risks": "Headache.\nMild nausea.", "study_duration": "6 months"},
+            generated_content={"summary": "Purpose: test"}
+        )
+
+        results = processor._validate(context, ["key_risks", "study_duration"])
+
+        assert results["content_analysis"]["critical_value_preservation"] == 1.0
+        assert not any("not preserved" in issue for issue in results["issues"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,41 @@
+"""
+Tests for the structured extraction models.
+"""
+import pytest
+
+from pydantic import ValidationError
+
+from app.core.extraction_models import KIExtractionSchema, normalize_study_duration
+from app.core.unified_extractor import _offline_ki_payload
+
+
+class TestStudyDuration:
+    """Test study duration normalization"""
+
+    @pytest.mark.parametrize("value", ["6 months", "up to 2 years", "12  weeks"])
+    def test_real_durations_are_kept(self, value):
+        """Test durations with a number and unit are returned unchanged"""
+        assert normalize_study_duration(value) == value
+
+    @pytest.mark.parametrize("value", ["", "TBD", "  the   study period ", "varies", "several months"])
+    def test_placeholders_are_cleared(self, value):
+        """Test blanks, placeholders and unitless phrases become empty"""
+        assert normalize_study_duration(value) == ""
+
+
+class TestKIExtractionSchema:
+    """Test KI extraction schema configuration"""
+
+    def test_schema_is_frozen_and_ignores_unknown_keys(self):
+        """Test extra LLM keys are dropped and instances are read-only"""
+        payload = _offline_ki_payload("STUDY_DURATION: 6 months")
+        schema = KIExtractionSchema(**payload, unexpected_field="ignored")
+
+        assert "unexpected_field" not in schema.model_dump()
+        with pytest.raises(ValidationError):
+            schema.study_duration = "1 year"
+        assert schema.model_copy(update={"study_duration": "1 year"}).study_duration == "1 year"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -69,3 +69,132 @@ def test_informed_consent_generation_from_pdf():
     assert result.success is True
     assert "Section 1" in result.content
     assert result.metadata["plugin_id"] == "informed-consent-ki"
+
+
+def test_stream_generate_reports_progress_and_content(sample_document):
+    async def collect():
+        return [
+            chunk
+            async for chunk in framework.stream_generate(
+                document_type="informed-consent-ki",
+                parameters={},
+                document=sample_document,
+            )
+        ]
+
+    chunks = asyncio.run(collect())
+    progress = [chunk for chunk in chunks if chunk.startswith("Processing agent")]
+    content = "".join(chunks[len(progress):])
+
+    assert progress == ["Processing agent 1/2...\n", "Processing agent 2/2...\n"]
+    assert "Section 1" in content
+    assert "6 months" in content
+
+
+def test_template_engine_reuses_compiled_templates():
+    engine = framework.template_engine
+    template = engine.get_template("informed-consent/ki-summary.j2")
+    assert engine.get_template("informed-consent/ki-summary.j2") is template
+
+    framework.clear_template_cache()
+    assert engine.get_template("informed-consent/ki-summary.j2") is not template
+
+
+def test_global_parameters_are_memoized_until_reload():
+    first = framework.get_global_parameters()
+    assert framework.get_global_parameters() is first
+
+    framework.reload_plugins()
+    refreshed = framework.get_global_parameters()
+    assert refreshed is not first
+    assert refreshed == first
+
+
+def test_concurrent_generations_keep_their_own_parameters():
+    complete = {
+        "study_name": "Study A",
+        "sponsor_name": "Sponsor A",
+        "protocol_number": "P-001",
+        "primary_endpoint": "Overall survival",
+        "sample_size": 100,
+        "protocol_type": "drug",
+    }
+    incomplete = {"study_name": "Study B", "protocol_type": "drug"}
+
+    async def run():
+        return await asyncio.gather(
+            framework.generate("clinical-protocol", complete),
+            framework.generate("clinical-protocol", incomplete),
+        )
+
+    first, second = asyncio.run(run())
+
+    assert first.metadata["workflow_steps"]["key_value_entry"]["completed"] is True
+    assert second.metadata["workflow_steps"]["key_value_entry"]["completed"] is False
+
+
+def test_template_failure_stops_before_running_agents(sample_document, monkeypatch):
+    plugin = asyncio.run(framework._select_plugin("informed-consent-ki"))
+    monkeypatch.setattr(plugin, "resolve_template", lambda parameters: None)
+    agent_runs = []
+
+    async def record_agents(plugin, context):
+        agent_runs.append(plugin)
+        yield "agents_done", {}
+
+    monkeypatch.setattr(framework, "_iter_agents", record_agents)
+
+    result = asyncio.run(
+        framework.generate(
+            document_type="informed-consent-ki",
+            parameters={},
+            document=sample_document,
+        )
+    )
+
+    assert result.success is False
+    assert result.error_message == "Failed to resolve template"
+    assert agent_runs == []
+
+
+def test_naturalization_runs_without_document_context(monkeypatch):
+    from app.core.agent_interfaces import AgentContext
+    from app.plugins.informed_consent_plugin import KINaturalizationAgent
+
+    prompts = []
+
+    class FakeExtractor:
+        model = "gpt-4o"
+
+        async def complete(self, prompt, system_prompt=None, max_tokens=None, temperature=None):
+            prompts.append(prompt)
+            return '{"study_purpose": "test an inhaler"}'
+
+    agent = KINaturalizationAgent()
+    monkeypatch.setattr(agent, "extractor", FakeExtractor())
+    context = AgentContext(
+        document_type="informed-consent-ki",
+        parameters={"document_context": None},
+        extracted_values={"study_purpose": "to test an inhaler."},
+    )
+
+    result = asyncio.run(agent.process(context))
+
+    assert result["generated_content"]["study_purpose"] == "test an inhaler"
+    assert prompts[0].startswith("Document excerpt:\n\n\nExtracted values")
+
+
+def test_template_engine_reloads_edited_templates(tmp_path):
+    import os
+    from app.core.template_renderer import SimpleTemplateRenderer
+
+    template_file = tmp_path / "note.j2"
+    template_file.write_text("first")
+    engine = SimpleTemplateRenderer(str(tmp_path))
+    assert engine.render("note.j2", {}) == "first"
+
+    template_file.write_text("second")
+    stat = template_file.stat()
+    os.utime(template_file, (stat.st_atime, stat.st_mtime + 5))
+
+    assert engine.render("note.j2", {}) == "second"
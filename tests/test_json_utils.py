@@ -0,0 +1,36 @@
+"""
+Tests for JSON helpers used to recover LLM output.
+"""
+import pytest
+
+from app.core.utils import JSONUtils
+
+
+class TestExtractJsonFromText:
+    """Test locating a JSON object inside surrounding text"""
+
+    def test_extracts_object_surrounded_by_prose(self):
+        """Test leading and trailing prose are ignored"""
+        text = 'Here you go:\n{"study_duration": "6 months"}\nLet me know!'
+        assert JSONUtils.extract_json_from_text(text) == {"study_duration": "6 months"}
+
+    def test_braces_inside_strings_do_not_end_object(self):
+        """Test braces and escaped quotes in string values are skipped"""
+        text = 'Result: {"key_risks": "pain } and \\"bleeding {", "nested": {"a": 1}} done'
+        assert JSONUtils.extract_json_from_text(text) == {
+            "key_risks": 'pain } and "bleeding {',
+            "nested": {"a": 1},
+        }
+
+    def test_returns_first_of_several_objects(self):
+        """Test only the first balanced object is returned"""
+        assert JSONUtils.extract_json_from_text('{"a": 1} and {"b": 2}') == {"a": 1}
+
+    @pytest.mark.parametrize("text", ["no json here", '{"a": 1', "{not json}"])
+    def test_returns_none_without_valid_object(self, text):
+        """Test unbalanced or invalid content yields None"""
+        assert JSONUtils.extract_json_from_text(text) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,206 @@
+"""
+Tests for the LLM response cache.
+"""
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from app.core import llm_cache
+from app.core.llm_cache import LLMCache, cache_for_temperature, completion_cache_prompt
+
+
+class Summary(BaseModel):
+    """Small schema used for parsed-result caching"""
+    title: str
+    points: list[str] = []
+
+
+class TestLLMCacheMemory:
+    """Test in-memory LRU and TTL behavior"""
+
+    def test_get_returns_stored_response(self):
+        """Test a stored response is returned for the same parameters only"""
+        cache = LLMCache()
+        cache.set("prompt", "model", 0.0, "response")
+        assert cache.get("prompt", "model", 0.0) == "response"
+        assert cache.get("prompt", "model", 0.5) is None
+        assert cache.get("other", "model", 0.0) is None
+
+    def test_evicts_least_recently_used_entry(self):
+        """Test reading an entry protects it from eviction"""
+        cache = LLMCache(max_size=2)
+        cache.set("a", "model", 0.0, "A")
+        cache.set("b", "model", 0.0, "B")
+        assert cache.get("a", "model", 0.0) == "A"
+
+        cache.set("c", "model", 0.0, "C")
+
+        assert cache.get("b", "model", 0.0) is None
+        assert cache.get("a", "model", 0.0) == "A"
+        assert cache.get("c", "model", 0.0) == "C"
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_expired_entries_are_dropped(self, monkeypatch):
+        """Test entries older than the TTL miss and are removed"""
+        cache = LLMCache(ttl_seconds=10)
+        cache.set("prompt", "model", 0.0, "response")
+
+        now = time.monotonic()
+        monkeypatch.setattr(llm_cache.time, "monotonic", lambda: now + 11)
+
+        assert cache.get("prompt", "model", 0.0) is None
+        stats = cache.get_stats()
+        assert stats["size"] == 0
+        assert stats["expirations"] == 1
+
+
+class TestCacheHelpers:
+    """Test the shared cache key and gating helpers"""
+
+    def test_only_temperature_zero_is_cached(self):
+        """Test sampled output bypasses the cache"""
+        cache = LLMCache()
+        assert cache_for_temperature(cache, 0.0) is cache
+        assert cache_for_temperature(cache, 0.7) is None
+
+    def test_completion_key_depends_on_max_tokens(self):
+        """Test a different output budget never reuses a truncated answer"""
+        assert completion_cache_prompt(None, "p", 100) != completion_cache_prompt(None, "p", 400)
+        assert completion_cache_prompt(None, "p", 100) == completion_cache_prompt("", "p", 100)
+
+
+class TestParsedResults:
+    """Test caching of validated Pydantic results"""
+
+    def test_round_trip_returns_equal_model(self):
+        """Test a parsed result is returned for the same schema"""
+        cache = LLMCache()
+        cache.set_parsed("prompt", "model", 0.0, Summary(title="t", points=["a"]))
+        assert cache.get_parsed("prompt", "model", 0.0, Summary) == Summary(title="t", points=["a"])
+
+    def test_callers_do_not_share_state_with_cache(self):
+        """Test mutating a stored or returned result does not change later hits"""
+        cache = LLMCache()
+        original = Summary(title="t", points=["a"])
+        cache.set_parsed("prompt", "model", 0.0, original)
+        original.points.append("from caller")
+
+        first = cache.get_parsed("prompt", "model", 0.0, Summary)
+        first.points.append("from first hit")
+
+        assert cache.get_parsed("prompt", "model", 0.0, Summary).points == ["a"]
+
+    def test_frozen_models_with_lists_are_copied(self):
+        """Test frozen models are copied too, since their lists stay mutable"""
+        class FrozenSummary(Summary):
+            model_config = {"frozen": True}
+
+        cache = LLMCache()
+        cache.set_parsed("prompt", "model", 0.0, FrozenSummary(title="t", points=["a"]))
+        cache.get_parsed("prompt", "model", 0.0, FrozenSummary).points.append("leak")
+
+        assert cache.get_parsed("prompt", "model", 0.0, FrozenSummary).points == ["a"]
+
+    def test_same_named_schemas_do_not_collide(self):
+        """Test schemas sharing a class name in different modules are kept apart"""
+        Other = type("Summary", (BaseModel,), {"__annotations__": {"title": str}, "__module__": "other.module"})
+        cache = LLMCache()
+        cache.set_parsed("prompt", "model", 0.0, Summary(title="t"))
+
+        assert Other.__qualname__ == Summary.__qualname__
+        assert cache.get_parsed("prompt", "model", 0.0, Other) is None
+
+    def test_hit_of_another_type_counts_as_miss(self):
+        """Test an entry that is not an instance of the schema is never returned"""
+        cache = LLMCache()
+        key = cache._get_cache_key("prompt", "model", 0.0, llm_cache._schema_namespace(Summary))
+        cache._store(key, {"title": "not a model"})
+
+        assert cache.get_parsed("prompt", "model", 0.0, Summary) is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_parsed_and_raw_entries_do_not_collide(self):
+        """Test a raw response and a parsed result for one prompt are kept apart"""
+        cache = LLMCache()
+        cache.set("prompt", "model", 0.0, "raw text")
+        assert cache.get_parsed("prompt", "model", 0.0, Summary) is None
+
+
+class TestBackingStore:
+    """Test the optional shelve-backed persistence"""
+
+    def test_entries_survive_restart(self, tmp_path):
+        """Test entries written before close are read by a new cache"""
+        path = str(tmp_path / "llm_cache")
+        cache = LLMCache(backing_path=path)
+        cache.set("prompt", "model", 0.0, "response")
+        cache.set_parsed("prompt", "model", 0.0, Summary(title="t", points=["a"]))
+        cache.close()
+
+        reopened = LLMCache(backing_path=path)
+        try:
+            assert reopened.get("prompt", "model", 0.0) == "response"
+            assert reopened.get_parsed("prompt", "model", 0.0, Summary) == Summary(title="t", points=["a"])
+        finally:
+            reopened.close()
+
+    def test_entries_failing_current_schema_are_dropped(self, tmp_path):
+        """Test a stored result that no longer validates is discarded"""
+        cache = LLMCache(backing_path=str(tmp_path / "llm_cache"))
+        try:
+            key = cache._get_cache_key("prompt", "model", 0.0, llm_cache._schema_namespace(Summary))
+            cache._disk[key.hex()] = ('{"heading": "old shape"}', time.time())
+
+            assert cache.get_parsed("prompt", "model", 0.0, Summary) is None
+            assert key.hex() not in cache._disk
+        finally:
+            cache.close()
+
+    def test_evicted_entries_leave_backing_store(self, tmp_path):
+        """Test the shelve file stays bounded by max_size"""
+        cache = LLMCache(max_size=2, backing_path=str(tmp_path / "llm_cache"))
+        try:
+            for prompt in ("a", "b", "c"):
+                cache.set(prompt, "model", 0.0, prompt.upper())
+
+            assert len(cache._disk) == 2
+            assert cache.get("a", "model", 0.0) is None
+        finally:
+            cache.close()
+
+    def test_expired_entries_are_swept_on_open(self, tmp_path):
+        """Test entries older than the TTL are removed when the file is reopened"""
+        path = str(tmp_path / "llm_cache")
+        cache = LLMCache(ttl_seconds=10, backing_path=path)
+        cache.set("fresh", "model", 0.0, "F")
+        cache._disk["stale"] = ("S", time.time() - 11)
+        cache.close()
+
+        reopened = LLMCache(ttl_seconds=10, backing_path=path)
+        try:
+            assert "stale" not in reopened._disk
+            assert len(reopened._disk) == 1
+        finally:
+            reopened.close()
+
+    def test_app_shutdown_closes_backing_store(self, tmp_path, monkeypatch):
+        """Test stopping the server flushes and closes the shelve file"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+
+        cache = LLMCache(backing_path=str(tmp_path / "llm_cache"))
+        monkeypatch.setattr(llm_cache, "_cache", cache)
+        with TestClient(app):
+            cache.set("prompt", "model", 0.0, "response")
+
+        assert cache._disk is None
+        reopened = LLMCache(backing_path=str(tmp_path / "llm_cache"))
+        try:
+            assert reopened.get("prompt", "model", 0.0) == "response"
+        finally:
+            reopened.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
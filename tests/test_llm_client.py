@@ -0,0 +1,72 @@
+"""
+Tests for the simplified Azure OpenAI client.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.config import AZURE_OPENAI_CONFIG
+from app.core.exceptions import LLMError
+from app.core.extraction_models import GenericExtractionSchema
+from app.core.llm_client import SimpleLLMClient
+
+
+class FakeParse:
+    """Structured-output stub recording peak concurrency"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def parse(self, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+        document = kwargs["messages"][-1]["content"]
+        if document.endswith("broken"):
+            raise RuntimeError("service unavailable")
+        parsed = GenericExtractionSchema(title=document[-5:], summary="s")
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(parsed=parsed))])
+
+
+@pytest.fixture
+def stub_client(monkeypatch):
+    """Client wired to a stub instead of Azure OpenAI"""
+    monkeypatch.setitem(AZURE_OPENAI_CONFIG, "api_key", "test-key")
+    monkeypatch.setitem(AZURE_OPENAI_CONFIG, "endpoint", "https://example.openai.azure.com")
+    client = SimpleLLMClient()
+    completions = FakeParse()
+    client.cache = None
+    client.client = SimpleNamespace(beta=SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    return client, completions
+
+
+class TestExtractMany:
+    """Test concurrent extraction of several jobs"""
+
+    def test_results_keep_job_order_within_concurrency_limit(self, stub_client):
+        """Test results align with jobs and concurrency stays bounded"""
+        client, completions = stub_client
+        jobs = [(f"doc-{i:02d}", GenericExtractionSchema, None) for i in range(10)]
+
+        results = asyncio.run(client.extract_many(jobs, max_concurrency=3))
+
+        assert [result.title for result in results] == [job[0][-5:] for job in jobs]
+        assert completions.peak == 3
+
+    def test_failed_job_does_not_cancel_others(self, stub_client):
+        """Test a failing extraction is returned in place as an LLMError"""
+        client, _ = stub_client
+        jobs = [("doc-ok", GenericExtractionSchema, None), ("doc-broken", GenericExtractionSchema, None)]
+
+        results = asyncio.run(client.extract_many(jobs))
+
+        assert results[0].title == "oc-ok"
+        assert isinstance(results[1], LLMError)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
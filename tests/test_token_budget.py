@@ -0,0 +1,86 @@
+"""
+Tests for truncating documents to a token budget.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import utils
+from app.core.utils import CHARS_PER_TOKEN, truncate_to_token_budget
+
+
+@pytest.fixture(autouse=True)
+def fresh_encoding_cache():
+    """Keep tokenizer lookups from leaking between tests"""
+    utils._get_encoding.cache_clear()
+    yield
+    utils._get_encoding.cache_clear()
+
+
+class FakeEncoding:
+    """One token per whitespace-separated word"""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, text, disallowed_special="all"):
+        if "<|endoftext|>" in text and disallowed_special != ():
+            raise ValueError("disallowed special token")
+        self.encoded.append(text)
+        return text.split()
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+class TestTruncateToTokenBudget:
+    """Test token and character budget truncation"""
+
+    def test_short_text_is_returned_unchanged(self):
+        """Test text that cannot exceed the budget skips tokenizing"""
+        assert truncate_to_token_budget("short text", 100, "gpt-4o") == "short text"
+
+    def test_cuts_at_token_boundary(self, monkeypatch):
+        """Test long text is cut to the token budget"""
+        fake = SimpleNamespace(encoding_for_model=lambda model: FakeEncoding())
+        monkeypatch.setattr(utils, "tiktoken", fake)
+
+        assert truncate_to_token_budget("one two three four five", 3, "gpt-4o") == "one two three"
+
+    def test_special_token_text_is_treated_as_plain_text(self, monkeypatch):
+        """Test documents containing special-token strings do not raise"""
+        fake = SimpleNamespace(encoding_for_model=lambda model: FakeEncoding())
+        monkeypatch.setattr(utils, "tiktoken", fake)
+
+        text = "one <|endoftext|> three four five"
+        assert truncate_to_token_budget(text, 4, "gpt-4o") == "one <|endoftext|> three four"
+
+    def test_only_a_bounded_prefix_is_encoded(self, monkeypatch):
+        """Test a huge document is not tokenized in full"""
+        encoding = FakeEncoding()
+        fake = SimpleNamespace(encoding_for_model=lambda model: encoding)
+        monkeypatch.setattr(utils, "tiktoken", fake)
+
+        text = "word " * 10000
+        assert truncate_to_token_budget(text, 3, "gpt-4o") == "word word word"
+        assert [len(chunk) for chunk in encoding.encoded] == [3 * 8]
+
+    def test_tokenizer_load_failure_falls_back_to_characters(self, monkeypatch):
+        """Test a failed encoding download uses the character budget, once"""
+        calls = []
+
+        def unavailable(name):
+            calls.append(name)
+            raise ConnectionError("no network")
+
+        fake = SimpleNamespace(encoding_for_model=unavailable, get_encoding=unavailable)
+        monkeypatch.setattr(utils, "tiktoken", fake)
+        text = "x" * 100
+
+        assert truncate_to_token_budget(text, 5, "gpt-4o") == text[:5 * CHARS_PER_TOKEN]
+        assert truncate_to_token_budget(text, 5, "gpt-4o") == text[:5 * CHARS_PER_TOKEN]
+        assert calls == ["gpt-4o"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
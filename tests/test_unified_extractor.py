@@ -0,0 +1,138 @@
+"""
+Tests for the unified extractor's request handling.
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from openai import AsyncAzureOpenAI
+
+from app.config import AZURE_OPENAI_CONFIG
+from app.core.extraction_models import GenericExtractionSchema
+from app.core.unified_extractor import UnifiedExtractor
+
+
+class FakeCompletions:
+    """Chat completions stub recording peak concurrency"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def create(self, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+        document = kwargs["messages"][-1]["content"]
+        content = "not json" if document.endswith("broken") else json.dumps({"title": document[-5:], "summary": "s"})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture
+def online_extractor():
+    """Extractor wired to a stub client instead of Azure OpenAI"""
+    extractor = UnifiedExtractor()
+    completions = FakeCompletions()
+    extractor.offline_mode = False
+    extractor.cache = None
+    extractor.llm_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return extractor, completions
+
+
+class TestOnlineConstruction:
+    """Test building an extractor against Azure OpenAI settings"""
+
+    def test_builds_online_client_from_config(self, monkeypatch):
+        """Test a configured extractor creates its client without any network call"""
+        monkeypatch.delenv("USE_OFFLINE_KI_EXTRACTOR", raising=False)
+        monkeypatch.setitem(AZURE_OPENAI_CONFIG, "api_key", "test-key")
+        monkeypatch.setitem(AZURE_OPENAI_CONFIG, "endpoint", "https://example.openai.azure.com")
+
+        extractor = UnifiedExtractor()
+
+        assert extractor.offline_mode is False
+        assert isinstance(extractor.llm_client, AsyncAzureOpenAI)
+
+
+class TestExtractMany:
+    """Test concurrent multi-document extraction"""
+
+    def test_results_keep_document_order_within_concurrency_limit(self, online_extractor):
+        """Test results align with inputs and concurrency stays bounded"""
+        extractor, completions = online_extractor
+        documents = [f"doc-{i:02d}" for i in range(10)]
+
+        results = asyncio.run(
+            extractor.extract_many(documents, GenericExtractionSchema, max_concurrency=3)
+        )
+
+        assert [result.title for result in results] == [doc[-5:] for doc in documents]
+        assert completions.peak == 3
+
+    def test_failed_document_does_not_cancel_others(self, online_extractor):
+        """Test a failing extraction is returned in place as an exception"""
+        extractor, _ = online_extractor
+
+        results = asyncio.run(
+            extractor.extract_many(["doc-ok", "doc-broken"], GenericExtractionSchema)
+        )
+
+        assert results[0].title == "oc-ok"
+        assert isinstance(results[1], Exception)
+
+
+class FakeStream:
+    """Async iterator of streamed chat completion chunks"""
+
+    def __init__(self, pieces):
+        self.pieces = iter(pieces)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            piece = next(self.pieces)
+        except StopIteration:
+            raise StopAsyncIteration
+        choices = [] if piece is None else [SimpleNamespace(delta=SimpleNamespace(content=piece))]
+        return SimpleNamespace(choices=choices)
+
+
+class TestCompleteStream:
+    """Test streamed completions"""
+
+    def test_yields_fragments_in_order(self, online_extractor):
+        """Test content deltas are yielded and empty chunks skipped"""
+        extractor, completions = online_extractor
+
+        async def create(**kwargs):
+            assert kwargs["stream"] is True
+            return FakeStream([None, "Hello", "", " world"])
+
+        completions.create = create
+
+        async def collect():
+            return [piece async for piece in extractor.complete_stream("Say hello")]
+
+        assert asyncio.run(collect()) == ["Hello", " world"]
+
+    def test_offline_mode_yields_single_completion(self):
+        """Test offline mode yields the full offline completion once"""
+        extractor = UnifiedExtractor()
+        prompt = 'Extracted values (JSON):\n{"study_duration": "6 months"}\n\nReturn JSON'
+
+        async def collect():
+            return [piece async for piece in extractor.complete_stream(prompt)]
+
+        pieces = asyncio.run(collect())
+        assert len(pieces) == 1
+        assert pieces[0] == asyncio.run(extractor.complete(prompt))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
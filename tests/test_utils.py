@@ -15,6 +15,8 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / 'app' / '.env'
 load_dotenv(env_path)
 
+logger = logging.getLogger(__name__)
+
 
 def setup_test_logging(name: str = __name__) -> logging.Logger:
     """
@@ -48,23 +50,17 @@ def setup_azure_openai() -> Tuple[Any, Any]:
     Set up Azure OpenAI embedding model and LLM for testing.
     
     Returns:
-        Tuple of (embed_model, llm) - embed_model is None for now, llm is GenericLLMExtractor
+        Tuple of (embed_model, llm) - embed_model is None for now, llm is SimpleLLMClient
     """
-    print("DEBUG: setup_azure_openai() - Starting", flush=True)
-    
     from app.core.llm_client import SimpleLLMClient
     
-    print("DEBUG: setup_azure_openai() - SimpleLLMClient imported", flush=True)
-    
     # Initialize LLM client which now uses direct OpenAI SDK
-    print("DEBUG: setup_azure_openai() - About to create SimpleLLMClient instance", flush=True)
     llm = SimpleLLMClient()
-    print(f"DEBUG: setup_azure_openai() - SimpleLLMClient created: {llm}", flush=True)
+    logger.debug("setup_azure_openai() - SimpleLLMClient created: %s", llm)
     
     # Embedding model not needed anymore since RAG pipeline was removed
     embed_model = None
     
-    print("DEBUG: setup_azure_openai() - Returning", flush=True)
     return embed_model, llm
 
 
@@ -0,0 +1,186 @@
+"""
+Tests for the modular validators and consistency tracking.
+"""
+import pytest
+
+from app.core.plugin_manager import ValidationRuleSet
+from app.core.types import ValidationConstants
+from app.core.validators import (
+    ConsistencyMetrics,
+    ConsistencyTracker,
+    ContentQualityValidator,
+    StructuralValidator,
+    ValidationContext,
+)
+
+
+def make_context(rendered):
+    return ValidationContext(
+        original={},
+        rendered=rendered,
+        rules=ValidationRuleSet([], {}, {}, [], []),
+        critical_values=[],
+    )
+
+
+class TestConsistencyMetrics:
+    """Test consistency metric bookkeeping"""
+
+    def test_structural_consistency_uses_unique_hash_count(self):
+        """Test repeated hashes count once towards uniqueness"""
+        metrics = ConsistencyMetrics()
+        for content_hash in ["aaaa", "aaaa", "bbbb", "aaaa"]:
+            metrics.add_content_hash(content_hash)
+
+        assert len(metrics.content_hashes) == 4
+        assert metrics.hash_counts == {"aaaa": 3, "bbbb": 1}
+        assert metrics.calculate_structural_consistency() == pytest.approx(0.75)
+
+    def test_running_word_count_stats_match_numpy(self):
+        """Test Welford running stats agree with a full recomputation"""
+        import numpy as np
+
+        counts = [120, 95, 130, 101, 99]
+        metrics = ConsistencyMetrics()
+        for count in counts:
+            metrics.add_word_count(count)
+
+        assert metrics.word_count_mean == pytest.approx(np.mean(counts))
+        assert metrics.word_count_std() == pytest.approx(np.std(counts))
+        expected_cv = np.std(counts) / np.mean(counts) * 100
+        assert metrics.calculate_coefficient_of_variation() == pytest.approx(expected_cv)
+
+    def test_history_is_bounded(self, monkeypatch):
+        """Test old samples are evicted once the history window is full"""
+        monkeypatch.setattr(ValidationConstants, "CONSISTENCY_HISTORY_SIZE", 3)
+        metrics = ConsistencyMetrics()
+        for content_hash in ["aaaa", "bbbb", "cccc", "cccc", "cccc"]:
+            metrics.add_content_hash(content_hash)
+            metrics.add_word_count(100)
+
+        assert list(metrics.content_hashes) == ["cccc", "cccc", "cccc"]
+        assert metrics.hash_counts == {"cccc": 3}
+        assert metrics.word_count_runs == 5
+        assert metrics.calculate_structural_consistency() == 1.0
+
+    def test_tracker_reuses_metrics_until_new_data(self):
+        """Test metrics snapshot is only rebuilt after tracking new output"""
+        tracker = ConsistencyTracker()
+        tracker.track("First output text here.", "informed-consent")
+        tracker.track("Second, longer output text here.", "informed-consent")
+
+        first = tracker.get_metrics("informed-consent")
+        assert tracker.metrics_by_type["informed-consent"].dirty is False
+        assert tracker.get_metrics("informed-consent") == first
+
+        tracker.track("Third output.", "informed-consent")
+        assert tracker.get_metrics("informed-consent")["runs_analyzed"] == 3
+
+    def test_tracker_reports_unique_outputs(self):
+        """Test tracker exposes unique output count per document type"""
+        tracker = ConsistencyTracker()
+        tracker.track("Same output text.", "informed-consent")
+        tracker.track("Same output text.", "informed-consent")
+
+        metrics = tracker.get_metrics("informed-consent")
+        assert metrics["runs_analyzed"] == 2
+        assert metrics["unique_outputs"] == 1
+        assert metrics["structural_consistency"] == 1.0
+
+    def test_tracker_counts_runs_from_worker_threads(self):
+        """Test tracking from concurrent threads loses no runs"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        tracker = ConsistencyTracker()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for i in range(200):
+                pool.submit(tracker.track, f"Output number {i}.", "informed-consent")
+
+        metrics = tracker.metrics_by_type["informed-consent"]
+        assert metrics.word_count_runs == 200
+
+    def test_report_averages_cv_across_types(self):
+        """Test overall report averages per-type CVs without touching unknown types"""
+        tracker = ConsistencyTracker()
+        tracker.track("one two three four", "informed-consent")
+        tracker.track("one two", "informed-consent")
+        tracker.track("alpha beta gamma", "clinical-protocol")
+        tracker.track("alpha beta gamma", "clinical-protocol")
+
+        report = tracker.get_report()
+        cvs = [m["cv"] for m in report["by_document_type"].values()]
+        assert report["overall_metrics"]["mean_cv"] == pytest.approx(sum(cvs) / 2)
+        assert report["overall_metrics"]["meets_target"] is False
+
+        assert tracker.get_report("unknown")["by_document_type"] == {}
+        assert "unknown" not in tracker.metrics_by_type
+
+
+class TestContentQualityValidator:
+    """Test sentence-level quality checks"""
+
+    def _warnings_for(self, rendered):
+        return ContentQualityValidator().validate(make_context(rendered)).results["warnings"]
+
+    def test_clean_text_has_no_sentence_warnings(self):
+        """Test well-formed sentences produce no warnings"""
+        warnings = self._warnings_for(
+            "This study tests a new drug. You may stop taking part at any time."
+        )
+        assert warnings == []
+
+    def test_sentence_issues_are_reported_once(self):
+        """Test each sentence issue is reported once regardless of occurrences"""
+        long_sentence = " ".join(["word"] * 55)
+        warnings = self._warnings_for(
+            f"Too short. the study lasts two years. also lowercase here. {long_sentence}."
+        )
+        assert warnings == [
+            "Sentence starting with lowercase",
+            "Very short sentence fragment",
+            "Excessively long sentence",
+        ]
+
+    @pytest.mark.parametrize("rendered", [
+        "The study is long enough. émile starts this sentence here.",
+        "The study is long enough. (parenthetical remark starts here).",
+        'The study is long enough. "quoted words start this one."',
+    ])
+    def test_any_non_uppercase_sentence_start_is_flagged(self, rendered):
+        """Test punctuation and non-ASCII lowercase starts are flagged"""
+        assert "Sentence starting with lowercase" in self._warnings_for(rendered)
+
+    def test_digit_and_accented_uppercase_starts_pass(self):
+        """Test sentences may start with a digit or a non-ASCII capital"""
+        warnings = self._warnings_for("Émile joins the study team. 12 visits happen each year.")
+        assert "Sentence starting with lowercase" not in warnings
+
+
+class TestStructuralValidator:
+    """Test section heading checks"""
+
+    def _warnings_for(self, headings):
+        rendered = "\n\n".join(f"{heading}\nBody text for this part." for heading in headings)
+        return StructuralValidator().validate(make_context(rendered)).results["warnings"]
+
+    def test_expected_sections_pass(self):
+        """Test nine distinct numbered sections produce no warning"""
+        assert self._warnings_for([f"Section {i}" for i in range(1, 10)]) == []
+
+    def test_duplicated_heading_is_reported(self):
+        """Test a repeated heading is caught even when the raw count matches"""
+        headings = ["Section 1"] + [f"Section {i}" for i in range(1, 9)]
+        assert self._warnings_for(headings) == ["Section count mismatch: found 8, expected 9"]
+
+    def test_non_numeric_heading_is_reported(self):
+        """Test a non-numbered heading does not count towards the sections"""
+        headings = [f"Section {i}" for i in range(1, 9)] + ["Section overview"]
+        assert self._warnings_for(headings) == ["Section count mismatch: found 8, expected 9"]
+
+    def test_text_without_headings_is_skipped(self):
+        """Test documents without section headings produce no warning"""
+        assert StructuralValidator().validate(make_context("Plain text only.")).results["warnings"] == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])